@@ -12,57 +12,160 @@ Usage:
     python benchmark_orchestrator.py persist         # Run Phase 7 persist to Excel
     python benchmark_orchestrator.py compare         # Compare current run to baseline
     python benchmark_orchestrator.py build-prompt <style>
+    python benchmark_orchestrator.py build-prompts-all   # One prompt per run_spec style
     python benchmark_orchestrator.py compute-rankings
 """
 
+import bisect
+import io
 import json
 import os
+import re
 import shutil
 import sys
 import uuid
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
 from config import (
-    PROJECT_ROOT, RUNS_DIR, EXCEL_PATH,
+    PROJECT_ROOT, RUNS_DIR, EXCEL_PATH, RUN_HISTORY_PATH,
     STYLE_ASSERTIONS_PATH, ACRUE_V3_PROMPT_PATH, RUN_SPEC_PATH,
     GEMINI_MODEL,
 )
 
-# Excel support
+# Fast JSON (optional; stdlib json is the fallback)
 try:
-    from openpyxl import Workbook, load_workbook
-    from openpyxl.styles import Font, Alignment, PatternFill
-    OPENPYXL_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    OPENPYXL_AVAILABLE = False
-    print("Warning: openpyxl not installed. Excel features disabled.")
-
-# Comparison support
-try:
-    from compare_runs import compare_runs, print_comparison_console, save_comparison, find_latest_prior_run
-    COMPARE_AVAILABLE = True
-except ImportError:
-    COMPARE_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
 # Base paths (kept for backward compat; prefer config.py imports)
 SCRIPT_DIR = PROJECT_ROOT
 
+ACRUE_DIMENSIONS = ("accuracy", "completeness", "relevance", "usefulness", "exceptional")
+
+# Letter grade <-> numeric value for averaging grades across images.
+# An average of at least _GRADE_CUTOFFS[i] earns _GRADE_LETTERS[i + 1].
+_GRADE_VALUES = {"A+": 5, "A": 4, "B": 3, "C": 2, "F": 1}
+_GRADE_CUTOFFS = (1.5, 2.5, 3.5, 4.5)
+_GRADE_LETTERS = ("F", "C", "B", "A", "A+")
+
+# Matches {STYLE_NAME}, {ASSERTIONS_ACCURACY}, ... placeholders in the prompt template
+_PLACEHOLDER_RE = re.compile(r"\{([A-Z_]+)\}")
+
+
+# ---------------------------------------------------------------------------
+# Lazy optional imports
+#
+# openpyxl/xlsxwriter are only needed by `persist`, so they are imported on
+# first use rather than at startup (keeps `build-prompt` and friends fast).
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def openpyxl_available() -> bool:
+    """Return True if openpyxl can be imported (attempted once per process)."""
+    try:
+        import openpyxl  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+@lru_cache(maxsize=None)
+def xlsxwriter_available() -> bool:
+    """Return True if the optional xlsxwriter fast writer can be imported."""
+    try:
+        import xlsxwriter  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+@lru_cache(maxsize=None)
+def _openpyxl_styles() -> dict:
+    """
+    Shared openpyxl style objects, built once on first use.
+
+    openpyxl styles are immutable, so one instance serves every cell.
+    Colors are 8-char ARGB so they stay opaque.
+    """
+    from openpyxl.styles import Font, PatternFill
+    return {
+        "bold": Font(bold=True),
+        "title_font": Font(bold=True, size=14),
+        "header_fill": PatternFill(start_color="FFCCCCCC", end_color="FFCCCCCC", fill_type="solid"),
+        "run_header_font": Font(bold=True, color="FFFFFFFF"),
+        "run_header_fill": PatternFill(start_color="FF4472C4", end_color="FF4472C4", fill_type="solid"),
+    }
+
 
 class ValidationError(Exception):
     """Raised when validation fails."""
     pass
 
 
+def _json_loads(data):
+    """Parse JSON bytes/str with orjson when installed, else stdlib json."""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize obj as 2-space indented JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _read_json(path: Path):
+    """Read and parse a JSON file."""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def _write_json(path: Path, obj):
+    """Write obj to path as indented JSON."""
+    with open(path, 'wb') as f:
+        f.write(_json_dumps(obj))
+
+
+def _print_json(obj):
+    """Print obj as indented JSON with non-ASCII escaped, so any console encoding can show it."""
+    print(json.dumps(obj, indent=2))
+
+
+def _read_json_if_exists(path: Path):
+    """Read a JSON file, or return None if it does not exist."""
+    try:
+        return _read_json(path)
+    except FileNotFoundError:
+        return None
+
+
+def _run_concurrently(*calls):
+    """
+    Run independent zero-argument callables on a thread pool.
+
+    Used to overlap run-directory file I/O, which is slow on cloud-synced
+    (OneDrive) folders. Results come back in call order; the first
+    exception raised by any call is re-raised.
+    """
+    with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+        futures = [pool.submit(call) for call in calls]
+        return [future.result() for future in futures]
+
+
 def load_run_spec() -> dict:
     """Load and return the run specification."""
-    if not RUN_SPEC_PATH.exists():
-        raise ValidationError(f"V1 FAIL: run_spec.json not found at {RUN_SPEC_PATH}")
-
     try:
-        with open(RUN_SPEC_PATH, 'r') as f:
-            return json.load(f)
+        return _read_json(RUN_SPEC_PATH)
+    except FileNotFoundError:
+        raise ValidationError(f"V1 FAIL: run_spec.json not found at {RUN_SPEC_PATH}")
     except json.JSONDecodeError as e:
         raise ValidationError(f"V2 FAIL: run_spec.json is not valid JSON: {e}")
 
@@ -76,18 +179,9 @@ def validate_phase1() -> dict:
     """
     errors = []
 
-    # V1: run_spec.json exists
-    if not RUN_SPEC_PATH.exists():
-        errors.append("V1 FAIL: run_spec.json does not exist")
-        # Can't continue without spec
-        raise ValidationError("\n".join(errors))
-
-    # V2: Valid JSON
-    try:
-        spec = load_run_spec()
-    except ValidationError as e:
-        errors.append(str(e))
-        raise ValidationError("\n".join(errors))
+    # V1 + V2: run_spec.json exists and is valid JSON (one open, no separate stat).
+    # Can't continue without spec, so load_run_spec's ValidationError propagates.
+    spec = load_run_spec()
 
     # V3: styles array has exactly 3 items
     styles = spec.get("styles", [])
@@ -108,7 +202,7 @@ def validate_phase1() -> dict:
     baseline_run_id = spec.get("baseline_run_id")
     if baseline_run_id:
         baseline_dir = RUNS_DIR / baseline_run_id
-        if not baseline_dir.exists():
+        if not baseline_dir.is_dir():
             errors.append(f"V6 FAIL: baseline_run_id directory not found: {baseline_dir}")
 
     # V7: GEMINI_API_KEY is set
@@ -146,8 +240,7 @@ def init_output_dir(spec: dict) -> Path:
     (output_dir / "restyled").mkdir(parents=True, exist_ok=True)
 
     # Copy run_spec.json
-    with open(output_dir / "run_spec.json", 'w') as f:
-        json.dump(spec, f, indent=2)
+    _write_json(output_dir / "run_spec.json", spec)
 
     print(f"Initialized output directory: {output_dir}")
     return output_dir
@@ -158,12 +251,22 @@ def get_style_slug(style: str) -> str:
     return style.lower().replace(" ", "_")
 
 
+@lru_cache(maxsize=None)
+def _load_style_catalog(path: Path, mtime_ns: int) -> dict:
+    """Parse the style assertions file once per (path, mtime)."""
+    return _read_json(path).get("styles", {})
+
+
+@lru_cache(maxsize=None)
+def _load_prompt_template(path: Path, mtime_ns: int) -> str:
+    """Read the ACRUE prompt template once per (path, mtime)."""
+    with open(path, 'r') as f:
+        return f.read()
+
+
 def load_style_assertions(style: str) -> dict:
     """Load assertions for a specific style."""
-    with open(STYLE_ASSERTIONS_PATH, 'r') as f:
-        data = json.load(f)
-
-    styles = data.get("styles", {})
+    styles = _load_style_catalog(STYLE_ASSERTIONS_PATH, STYLE_ASSERTIONS_PATH.stat().st_mtime_ns)
     if style in styles:
         return styles[style]
 
@@ -211,86 +314,83 @@ def load_style_assertions(style: str) -> dict:
 
 def build_acrue_prompt(style: str, style_data: dict) -> str:
     """Build the ACRUE v3 evaluation prompt for a specific style."""
-    with open(ACRUE_V3_PROMPT_PATH, 'r') as f:
-        template = f.read()
+    template = _load_prompt_template(ACRUE_V3_PROMPT_PATH, ACRUE_V3_PROMPT_PATH.stat().st_mtime_ns)
 
     assertions = style_data.get("assertions", {})
 
-    def format_assertions(dimension: str) -> str:
-        items = assertions.get(dimension, [])
-        lines = []
-        for i, q in enumerate(items, 1):
-            prefix = dimension[0].upper()
-            lines.append(f"{prefix}{i}. {q}")
-        return "\n".join(lines)
+    subs = {
+        "STYLE_NAME": style,
+        "STYLE_DESCRIPTION": style_data.get("description", ""),
+    }
+    for dimension in ACRUE_DIMENSIONS:
+        prefix = dimension[0].upper()
+        subs[f"ASSERTIONS_{dimension.upper()}"] = "\n".join(
+            f"{prefix}{i}. {q}" for i, q in enumerate(assertions.get(dimension, []), 1)
+        )
+
+    # Single pass over the template; unknown placeholders are left untouched
+    return _PLACEHOLDER_RE.sub(lambda m: subs.get(m.group(1), m.group(0)), template)
 
-    prompt = template.replace("{STYLE_NAME}", style)
-    prompt = prompt.replace("{STYLE_DESCRIPTION}", style_data.get("description", ""))
-    prompt = prompt.replace("{ASSERTIONS_ACCURACY}", format_assertions("accuracy"))
-    prompt = prompt.replace("{ASSERTIONS_COMPLETENESS}", format_assertions("completeness"))
-    prompt = prompt.replace("{ASSERTIONS_RELEVANCE}", format_assertions("relevance"))
-    prompt = prompt.replace("{ASSERTIONS_USEFULNESS}", format_assertions("usefulness"))
-    prompt = prompt.replace("{ASSERTIONS_EXCEPTIONAL}", format_assertions("exceptional"))
 
-    return prompt
+def build_all_prompts(styles: list) -> dict:
+    """
+    Build ACRUE v3 prompts for several styles concurrently.
+
+    Returns a dict of style -> prompt in the order given. The first build
+    warms the assertions/template caches; the rest are mostly formatting.
+    """
+    def build(style: str) -> str:
+        return build_acrue_prompt(style, load_style_assertions(style))
 
+    with ThreadPoolExecutor(max_workers=max(1, len(styles))) as pool:
+        return dict(zip(styles, pool.map(build, styles)))
 
-def compute_feasibility_rankings(acrue_results: list) -> dict:
+
+def compute_feasibility_rankings(acrue_results: list, timestamp: str = None) -> dict:
     """
     Compute feasibility rankings from ACRUE v3 evaluation results.
 
     Groups scores by style and ranks by average weighted total.
+    `timestamp` defaults to now; main() passes one shared value per command.
     """
-    # Group by style
-    style_scores = {}
+    # Group by style in a single pass, keeping running sums per style:
+    # [count, weighted_total, percentage, grade_value, *dimension weighted_scores]
+    style_totals = {}
     for result in acrue_results:
         style = result["style"]
-        if style not in style_scores:
-            style_scores[style] = []
+        totals = style_totals.get(style)
+        if totals is None:
+            totals = style_totals[style] = [0] * (4 + len(ACRUE_DIMENSIONS))
 
         # Get the summary scores
         summary = result.get("summary", {})
-        weighted_total = summary.get("weighted_total", result.get("total", 0))
-        percentage = summary.get("percentage", result.get("percentage", 0))
-        grade = summary.get("grade", result.get("grade", "F"))
-
-        style_scores[style].append({
-            "weighted_total": weighted_total,
-            "percentage": percentage,
-            "grade": grade,
-            "dimensions": result.get("dimensions", {})
-        })
+        dimensions = result.get("dimensions", {})
+
+        totals[0] += 1
+        totals[1] += summary.get("weighted_total", result.get("total", 0))
+        totals[2] += summary.get("percentage", result.get("percentage", 0))
+        totals[3] += _GRADE_VALUES.get(summary.get("grade", result.get("grade", "F")), 1)
+        for i, dim in enumerate(ACRUE_DIMENSIONS, 4):
+            totals[i] += dimensions.get(dim, {}).get("weighted_score", 0)
 
     # Calculate averages and build rankings
     rankings_data = []
-    for style, scores in style_scores.items():
-        avg_score = sum(s["weighted_total"] for s in scores) / len(scores)
-        avg_pct = sum(s["percentage"] for s in scores) / len(scores)
-
-        # Determine average grade
-        grade_values = {"A+": 5, "A": 4, "B": 3, "C": 2, "F": 1}
-        avg_grade_val = sum(grade_values.get(s["grade"], 1) for s in scores) / len(scores)
-        if avg_grade_val >= 4.5:
-            avg_grade = "A+"
-        elif avg_grade_val >= 3.5:
-            avg_grade = "A"
-        elif avg_grade_val >= 2.5:
-            avg_grade = "B"
-        elif avg_grade_val >= 1.5:
-            avg_grade = "C"
-        else:
-            avg_grade = "F"
+    for style, totals in style_totals.items():
+        count = totals[0]
+        avg_score = totals[1] / count
+        avg_pct = totals[2] / count
+
+        # Determine average grade (bisect_right: a value equal to a cutoff rounds up)
+        avg_grade_val = totals[3] / count
+        avg_grade = _GRADE_LETTERS[bisect.bisect_right(_GRADE_CUTOFFS, avg_grade_val)]
 
         # Build reasoning from dimension breakdowns
-        dim_summaries = []
-        for dim in ["accuracy", "completeness", "relevance", "usefulness", "exceptional"]:
-            dim_scores = [s["dimensions"].get(dim, {}).get("weighted_score", 0)
-                         for s in scores if "dimensions" in s]
-            if dim_scores:
-                dim_avg = sum(dim_scores) / len(dim_scores)
-                dim_summaries.append(f"{dim.title()}: {dim_avg:.1f}")
+        dim_summaries = [
+            f"{dim.title()}: {dim_total / count:.1f}"
+            for dim, dim_total in zip(ACRUE_DIMENSIONS, totals[4:])
+        ]
 
-        reasoning = f"Average across {len(scores)} images. " + ", ".join(dim_summaries)
+        reasoning = f"Average across {count} images. " + ", ".join(dim_summaries)
 
         rankings_data.append({
             "style": style,
@@ -300,25 +400,36 @@ def compute_feasibility_rankings(acrue_results: list) -> dict:
             "reasoning": reasoning
         })
 
-    # Sort by avg_score descending (highest = rank 1)
-    rankings_data.sort(key=lambda x: x["avg_score"], reverse=True)
-
-    # Assign ranks
-    rankings = []
-    for i, data in enumerate(rankings_data, 1):
-        rankings.append({
-            "rank": i,
-            **data
-        })
+    # Sort by avg_score descending (highest = rank 1) and assign ranks
+    rankings_data.sort(key=itemgetter("avg_score"), reverse=True)
+    rankings = [{"rank": i, **data} for i, data in enumerate(rankings_data, 1)]
 
     return {
         "judge": f"{GEMINI_MODEL} (ACRUE v3)",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": timestamp or datetime.now().isoformat(),
         "methodology": "Rankings computed from ACRUE v3 weighted_total averages",
         "rankings": rankings
     }
 
 
+def _score_3(styles: list, ranks: dict, fw: float, pw: float) -> list:
+    """
+    Fast path for the validated 3-style run (V3): unrolled scoring.
+
+    Returns the same sorted (final_score, spec_index, style, g_rank, o_rank)
+    tuples as the generic loop in synthesize_results.
+    """
+    s0, s1, s2 = styles
+    g0, o0 = ranks.get(s0, (3, 3))
+    g1, o1 = ranks.get(s1, (3, 3))
+    g2, o2 = ranks.get(s2, (3, 3))
+    return sorted((
+        ((fw * g0) + (pw * o0), 0, s0, g0, o0),
+        ((fw * g1) + (pw * o1), 1, s1, g1, o1),
+        ((fw * g2) + (pw * o2), 2, s2, g2, o2),
+    ))
+
+
 def synthesize_results(spec: dict, gemini_rankings: dict, opus_rankings: dict) -> dict:
     """
     Phase 6: SYNTHESIS
@@ -328,29 +439,37 @@ def synthesize_results(spec: dict, gemini_rankings: dict, opus_rankings: dict) -
     feasibility_weight = spec["synthesis"]["feasibility_weight"]
     preference_weight = spec["synthesis"]["preference_weight"]
 
-    # Build lookup for ranks
-    gemini_ranks = {r["style"]: r["rank"] for r in gemini_rankings["rankings"]}
-    opus_ranks = {r["style"]: r["rank"] for r in opus_rankings["rankings"]}
-
-    # Calculate final scores
-    final_scores = []
-    for style in spec["styles"]:
-        g_rank = gemini_ranks.get(style, 3)
-        o_rank = opus_ranks.get(style, 3)
-        final_score = (feasibility_weight * g_rank) + (preference_weight * o_rank)
-        final_scores.append({
+    # Build one lookup of [gemini_rank, opus_rank] per style (missing rank = 3)
+    ranks = {}
+    for judge, judge_rankings in enumerate((gemini_rankings, opus_rankings)):
+        for r in judge_rankings["rankings"]:
+            ranks.setdefault(r["style"], [3, 3])[judge] = r["rank"]
+
+    # Calculate final scores as tuples; the spec index breaks ties so the
+    # natural tuple sort keeps spec order for equal scores.
+    # Sort by final_score (lowest = winner).
+    styles = spec["styles"]
+    if len(styles) == 3:
+        scored = _score_3(styles, ranks, feasibility_weight, preference_weight)
+    else:
+        scored = []
+        for i, style in enumerate(styles):
+            g_rank, o_rank = ranks.get(style, (3, 3))
+            final_score = (feasibility_weight * g_rank) + (preference_weight * o_rank)
+            scored.append((final_score, i, style, g_rank, o_rank))
+        scored.sort()
+
+    # Assign ranks
+    final_scores = [
+        {
             "style": style,
             "gemini_rank": g_rank,
             "opus_rank": o_rank,
-            "final_score": final_score
-        })
-
-    # Sort by final_score (lowest = winner)
-    final_scores.sort(key=lambda x: x["final_score"])
-
-    # Assign ranks
-    for i, item in enumerate(final_scores, 1):
-        item["rank"] = i
+            "final_score": final_score,
+            "rank": rank,
+        }
+        for rank, (final_score, _, style, g_rank, o_rank) in enumerate(scored, 1)
+    ]
 
     winner = final_scores[0]["style"]
 
@@ -364,129 +483,345 @@ def synthesize_results(spec: dict, gemini_rankings: dict, opus_rankings: dict) -
     }
 
 
-def generate_report(spec: dict, gemini: dict, opus: dict, synthesis: dict,
-                    comparison: dict = None) -> str:
-    """Generate the final report.md content, optionally including comparison."""
-    run_id = spec["run_id"]
+_REPORT_HEADER = """\
+# Benchmark Run: {run_id}
 
-    lines = [
-        f"# Benchmark Run: {run_id}",
-        "",
-        "## Final Rankings",
-        "",
-        "| Rank | Style | Gemini Rank | Opus Rank | Final Score |",
-        "|------|-------|-------------|-----------|-------------|"
-    ]
+## Final Rankings
 
-    for r in synthesis["rankings"]:
-        lines.append(f"| {r['rank']} | {r['style']} | {r['gemini_rank']} | {r['opus_rank']} | {r['final_score']:.2f} |")
-
-    lines.extend([
-        "",
-        f"**Winner: {synthesis['winner']}**",
-        "",
-        "## Gemini Assessment (Feasibility)",
-        ""
-    ])
+| Rank | Style | Gemini Rank | Opus Rank | Final Score |
+|------|-------|-------------|-----------|-------------|
+"""
 
-    for r in gemini["rankings"]:
-        lines.append(f"### {r['rank']}. {r['style']} (Score: {r['avg_score']}/25.0, {r['avg_percentage']:.1f}%, Grade: {r['avg_grade']})")
-        lines.append(f"{r['reasoning']}")
-        lines.append("")
+_REPORT_METADATA = """\
+## Metadata
+
+- **Run ID**: {run_id}
+- **Pipeline Version**: {pipeline_version}
+- **ACRUE Version**: {acrue_version}
+- **Gemini Model**: {gemini_model}
+- **Opus Model**: {opus_model}
+- **Timestamp**: {timestamp}
+- **Styles Tested**: {styles}
+- **Images Per Style**: {image_count}
+- **Total Evaluations**: {total_evaluations}
+"""
 
-    lines.extend([
-        "## Opus Assessment (Preference)",
-        ""
-    ])
 
-    for r in opus["rankings"]:
-        lines.append(f"### {r['rank']}. {r['style']} (Appeal: {r.get('appeal_score', 'N/A')})")
-        lines.append(f"{r['reasoning']}")
-        lines.append("")
+def generate_report(spec: dict, gemini: dict, opus: dict, synthesis: dict,
+                    comparison: dict = None, timestamp: str = None) -> str:
+    """Generate the final report.md content, optionally including comparison."""
+    run_id = spec["run_id"]
+    timestamp = timestamp or datetime.now().isoformat()
+
+    buf = io.StringIO()
+    write = buf.write
+
+    write(_REPORT_HEADER.format_map({"run_id": run_id}))
+    buf.writelines(
+        f"| {r['rank']} | {r['style']} | {r['gemini_rank']} | {r['opus_rank']} | {r['final_score']:.2f} |\n"
+        for r in synthesis["rankings"]
+    )
+
+    write(f"\n**Winner: {synthesis['winner']}**\n\n## Gemini Assessment (Feasibility)\n\n")
+    buf.writelines(
+        f"### {r['rank']}. {r['style']} (Score: {r['avg_score']}/25.0, {r['avg_percentage']:.1f}%, Grade: {r['avg_grade']})\n"
+        f"{r['reasoning']}\n\n"
+        for r in gemini["rankings"]
+    )
+
+    write("## Opus Assessment (Preference)\n\n")
+    buf.writelines(
+        f"### {r['rank']}. {r['style']} (Appeal: {r.get('appeal_score', 'N/A')})\n"
+        f"{r['reasoning']}\n\n"
+        for r in opus["rankings"]
+    )
 
     # --- Comparison section (new in v1.1) ---
     if comparison and "styles" in comparison:
-        lines.extend([
-            "## Comparison vs Baseline",
-            "",
-            f"Baseline: **{comparison.get('baseline_run_id', 'N/A')}**",
-            "",
-            "| Style | Baseline | Current | Delta | Status |",
-            "|-------|----------|---------|-------|--------|",
-        ])
-        for s in comparison["styles"]:
-            sign = "+" if s["delta_pct"] > 0 else ""
-            lines.append(
-                f"| {s['style']} | {s['baseline_pct']:.1f}% | {s['current_pct']:.1f}% "
-                f"| {sign}{s['delta_pct']:.1f}% | {s['status']} |"
-            )
+        write(
+            "## Comparison vs Baseline\n\n"
+            f"Baseline: **{comparison.get('baseline_run_id', 'N/A')}**\n\n"
+            "| Style | Baseline | Current | Delta | Status |\n"
+            "|-------|----------|---------|-------|--------|\n"
+        )
+        buf.writelines(
+            f"| {s['style']} | {s['baseline_pct']:.1f}% | {s['current_pct']:.1f}% "
+            f"| {'+' if s['delta_pct'] > 0 else ''}{s['delta_pct']:.1f}% | {s['status']} |\n"
+            for s in comparison["styles"]
+        )
         summary_c = comparison.get("summary", {})
-        lines.extend([
-            "",
-            f"**Verdict: {summary_c.get('overall_verdict', 'N/A')}** "
+        write(
+            f"\n**Verdict: {summary_c.get('overall_verdict', 'N/A')}** "
             f"({summary_c.get('improved', 0)} improved, "
             f"{summary_c.get('regressed', 0)} regressed, "
-            f"{summary_c.get('unchanged', 0)} unchanged)",
-            "",
-        ])
-
-    lines.extend([
-        "## Metadata",
-        "",
-        f"- **Run ID**: {run_id}",
-        f"- **Pipeline Version**: {spec['pipeline_version']}",
-        f"- **ACRUE Version**: {spec['acrue_version']}",
-        f"- **Gemini Model**: {spec['judges']['feasibility']['model']}",
-        f"- **Opus Model**: {spec['judges']['preference']['model']}",
-        f"- **Timestamp**: {datetime.now().isoformat()}",
-        f"- **Styles Tested**: {', '.join(spec['styles'])}",
-        f"- **Images Per Style**: {spec['image_count']}",
-        f"- **Total Evaluations**: {spec['image_count'] * len(spec['styles'])}",
-        ""
-    ])
+            f"{summary_c.get('unchanged', 0)} unchanged)\n\n"
+        )
 
-    return "\n".join(lines)
+    write(_REPORT_METADATA.format_map({
+        "run_id": run_id,
+        "pipeline_version": spec["pipeline_version"],
+        "acrue_version": spec["acrue_version"],
+        "gemini_model": spec["judges"]["feasibility"]["model"],
+        "opus_model": spec["judges"]["preference"]["model"],
+        "timestamp": timestamp,
+        "styles": ", ".join(spec["styles"]),
+        "image_count": spec["image_count"],
+        "total_evaluations": spec["image_count"] * len(spec["styles"]),
+    }))
+
+    return buf.getvalue()
 
 
 def _is_valid_xlsx(path: Path) -> bool:
-    """Check whether a file is a valid OOXML .xlsx (ZIP-based), not OLE2 .xls."""
+    """
+    Check whether a file is a valid OOXML .xlsx (ZIP-based), not OLE2 .xls.
+
+    Only the ZIP signature and central directory are read; no sheet XML is parsed.
+    """
     if not path.exists():
         return False
     try:
         with open(path, "rb") as f:
             magic = f.read(4)
-        # OLE2 magic: D0 CF 11 E0   (old .xls format)
-        if magic == b"\xd0\xcf\x11\xe0":
+        # Must start with a ZIP local file header (or empty-archive record);
+        # this rejects OLE2 magic D0 CF 11 E0 (old .xls format)
+        if magic not in (b"PK\x03\x04", b"PK\x05\x06"):
             return False
-        # Try loading with openpyxl
-        load_workbook(path)
-        return True
-    except Exception:
+        with zipfile.ZipFile(path) as zf:
+            return "xl/workbook.xml" in zf.namelist()
+    except (OSError, zipfile.BadZipFile):
         return False
 
 
+SUMMARY_HEADERS = [
+    "run_id", "timestamp", "pipeline_version", "acrue_version",
+    "styles", "image_count", "winner", "gemini_top", "opus_top",
+    "artifacts_path", "vs_baseline", "regressions", "improvements",
+]
+
+RUN_DETAIL_HEADERS = ["Rank", "Style", "Gemini Rank", "Opus Rank", "Final Score"]
+
+# Excel sheet names: at most 31 chars, none of []:*?/\, no leading/trailing
+# apostrophe, and unique ignoring case
+_SHEET_NAME_MAX = 31
+_SHEET_NAME_INVALID_RE = re.compile(r"[\[\]:*?/\\]")
+
+
+def _sheet_name(run_id: str, used: set) -> str:
+    """
+    Return a valid, case-insensitively unique sheet name for run_id.
+
+    `used` holds the lowercased names already taken and is updated in place.
+    Collisions get a "~2", "~3", ... suffix within the length limit.
+    """
+    base = _SHEET_NAME_INVALID_RE.sub("", str(run_id))[:_SHEET_NAME_MAX].strip("'") or "Run"
+    name = base
+    n = 1
+    while name.lower() in used:
+        n += 1
+        suffix = f"~{n}"
+        name = base[:_SHEET_NAME_MAX - len(suffix)] + suffix
+    used.add(name.lower())
+    return name
+
+
+def _styled_cell(ws, value, font=None, fill=None):
+    """Build a WriteOnlyCell carrying optional font/fill styling."""
+    from openpyxl.cell import WriteOnlyCell
+
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    return cell
+
+
 def _create_summary_headers(ws):
-    """Write header row on a Summary worksheet."""
-    headers = [
-        "run_id", "timestamp", "pipeline_version", "acrue_version",
-        "styles", "image_count", "winner", "gemini_top", "opus_top",
-        "artifacts_path", "vs_baseline", "regressions", "improvements",
-    ]
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = Font(bold=True)
-        cell.fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+    """Write header row on a write-only Summary worksheet."""
+    styles = _openpyxl_styles()
+    ws.append([
+        _styled_cell(ws, header, styles["bold"], styles["header_fill"])
+        for header in SUMMARY_HEADERS
+    ])
 
 
-def persist_to_excel(spec: dict, synthesis: dict, comparison: dict = None):
+def _write_run_sheet(wb, record: dict, sheet_name: str):
+    """Write the per-run detail sheet for one run history record."""
+    run_id = record["run_id"]
+    run_ws = wb.create_sheet(sheet_name)
+    styles = _openpyxl_styles()
+
+    # Header
+    run_ws.append([_styled_cell(run_ws, f"Benchmark Run: {run_id}", styles["title_font"])])
+    run_ws.append([_styled_cell(run_ws, f"Winner: {record['winner']}", styles["bold"])])
+    run_ws.append([])
+
+    # Rankings table
+    run_ws.append([_styled_cell(run_ws, "Final Rankings", styles["bold"])])
+    run_ws.append([
+        _styled_cell(run_ws, header, styles["run_header_font"], styles["run_header_fill"])
+        for header in RUN_DETAIL_HEADERS
+    ])
+
+    for row in record["rankings"]:
+        run_ws.append(row)
+
+
+def _append_run_history(record: dict):
+    """Append one run record to the JSONL history and flush it to disk."""
+    line = orjson.dumps(record) if ORJSON_AVAILABLE else json.dumps(record).encode("utf-8")
+    with open(RUN_HISTORY_PATH, 'ab') as f:
+        f.write(line + b"\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _iter_run_history():
+    """Yield run history records one line at a time."""
+    if not RUN_HISTORY_PATH.exists():
+        return
+    with open(RUN_HISTORY_PATH, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield _json_loads(line)
+
+
+def _seed_run_history_from_workbook(path: Path):
+    """
+    One-time migration: copy Summary rows and run sheets from an existing
+    workbook into the JSONL history so the workbook can be rebuilt from it.
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True)
+    try:
+        details = {}
+        for name in wb.sheetnames:
+            if name == "Summary":
+                continue
+            rows = list(wb[name].iter_rows(values_only=True))
+            winner = rows[1][0] if len(rows) > 1 and rows[1] else ""
+            if isinstance(winner, str) and winner.startswith("Winner: "):
+                winner = winner[len("Winner: "):]
+            rankings = [list(row[:len(RUN_DETAIL_HEADERS)]) for row in rows[5:]
+                        if row and row[0] is not None]
+            details[name] = {"winner": winner, "rankings": rankings}
+
+        rows = []
+        if "Summary" in wb.sheetnames:
+            for row in wb["Summary"].iter_rows(min_row=2, values_only=True):
+                if not row or row[0] is None:
+                    continue
+                summary = list(row[:len(SUMMARY_HEADERS)])
+                summary += [None] * (len(SUMMARY_HEADERS) - len(summary))
+                rows.append(summary)
+
+        # Replay the writers' sheet naming (latest row per run_id, in order)
+        # so truncated or de-duplicated sheet names map back to their run
+        latest = {str(summary[0]): i for i, summary in enumerate(rows)}
+        used = {"summary"}
+        sheet_names = {run_id: _sheet_name(run_id, used)
+                       for i, run_id in enumerate(str(summary[0]) for summary in rows)
+                       if latest[run_id] == i}
+
+        records = []
+        for summary in rows:
+            run_id = str(summary[0])
+            detail = (details.get(run_id) or details.get(sheet_names[run_id])
+                      or {"winner": summary[6], "rankings": []})
+            records.append({"run_id": run_id, "summary": summary, **detail})
+    finally:
+        wb.close()
+
+    for record in records:
+        _append_run_history(record)
+    print(f"Migrated {len(records)} run(s) from {path.name} to {RUN_HISTORY_PATH.name}")
+
+
+def _iter_run_records(pending: dict):
+    """Yield the recorded run history followed by the pending (unsaved) record."""
+    yield from _iter_run_history()
+    yield pending
+
+
+def _iter_latest_runs(latest: dict, pending: dict):
+    """Yield the newest record for each run_id (by history index)."""
+    for i, record in enumerate(_iter_run_records(pending)):
+        if latest[record["run_id"]] == i:
+            yield record
+
+
+def _write_workbook_openpyxl(path: Path, pending: dict):
+    """Rebuild the tracker workbook from history plus `pending` (openpyxl write-only)."""
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    summary_ws = wb.create_sheet("Summary")
+    _create_summary_headers(summary_ws)
+
+    # A re-persisted run keeps every Summary row but only its latest detail sheet
+    latest = {}
+    for i, record in enumerate(_iter_run_records(pending)):
+        summary_ws.append(record["summary"])
+        latest[record["run_id"]] = i
+
+    used = {"summary"}
+    for record in _iter_latest_runs(latest, pending):
+        _write_run_sheet(wb, record, _sheet_name(record["run_id"], used))
+
+    wb.save(path)
+
+
+def _write_workbook_xlsxwriter(path: Path, pending: dict):
+    """Rebuild the tracker workbook from history plus `pending` (xlsxwriter, row-streamed)."""
+    import xlsxwriter
+
+    wb = xlsxwriter.Workbook(str(path), {"constant_memory": True})
+    try:
+        summary_fmt = wb.add_format({"bold": True, "bg_color": "#CCCCCC"})
+        title_fmt = wb.add_format({"bold": True, "font_size": 14})
+        bold_fmt = wb.add_format({"bold": True})
+        run_header_fmt = wb.add_format({"bold": True, "font_color": "#FFFFFF", "bg_color": "#4472C4"})
+
+        summary_ws = wb.add_worksheet("Summary")
+        summary_ws.write_row(0, 0, SUMMARY_HEADERS, summary_fmt)
+
+        latest = {}
+        for i, record in enumerate(_iter_run_records(pending)):
+            summary_ws.write_row(i + 1, 0, record["summary"])
+            latest[record["run_id"]] = i
+
+        used = {"summary"}
+        for record in _iter_latest_runs(latest, pending):
+            run_id = record["run_id"]
+            run_ws = wb.add_worksheet(_sheet_name(run_id, used))
+            run_ws.write(0, 0, f"Benchmark Run: {run_id}", title_fmt)
+            run_ws.write(1, 0, f"Winner: {record['winner']}", bold_fmt)
+            run_ws.write(3, 0, "Final Rankings", bold_fmt)
+            run_ws.write_row(4, 0, RUN_DETAIL_HEADERS, run_header_fmt)
+            for row_num, row in enumerate(record["rankings"], 5):
+                run_ws.write_row(row_num, 0, row)
+    finally:
+        wb.close()
+
+
+def persist_to_excel(spec: dict, synthesis: dict, comparison: dict = None,
+                     timestamp: str = None):
     """
     Phase 7: PERSIST
 
-    Append results to ai_restyle_benchmark.xlsx.
+    Rebuild ai_restyle_benchmark.xlsx from runs.jsonl plus this run, then
+    append the run to runs.jsonl once the new workbook is in place.
+    The workbook is streamed with xlsxwriter when installed (openpyxl
+    write-only mode otherwise), so the existing file is never parsed and
+    memory stays bounded to one row at a time.
     Handles corrupted OLE2 files by backing up and recreating.
     """
-    if not OPENPYXL_AVAILABLE:
-        print("Warning: openpyxl not available, skipping Excel persist")
+    # xlsxwriter alone is enough to write the workbook; openpyxl is only
+    # required for the fallback writer and the one-time migration below
+    if not (xlsxwriter_available() or openpyxl_available()):
+        print("Warning: neither xlsxwriter nor openpyxl available, skipping Excel persist")
         return
 
     run_id = spec["run_id"]
@@ -499,30 +834,13 @@ def persist_to_excel(spec: dict, synthesis: dict, comparison: dict = None):
         shutil.copy2(EXCEL_PATH, backup)
         EXCEL_PATH.unlink()
 
-    # Load or create workbook
-    if EXCEL_PATH.exists():
-        wb = load_workbook(EXCEL_PATH)
-    else:
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Summary"
-        _create_summary_headers(ws)
-
-    # Get or create summary sheet
-    if "Summary" in wb.sheetnames:
-        summary_ws = wb["Summary"]
-    else:
-        summary_ws = wb.create_sheet("Summary", 0)
-        _create_summary_headers(summary_ws)
-
-    # Ensure header row has the new comparison columns (migration)
-    if summary_ws.cell(row=1, column=11).value is None:
-        summary_ws.cell(row=1, column=11, value="vs_baseline").font = Font(bold=True)
-        summary_ws.cell(row=1, column=12, value="regressions").font = Font(bold=True)
-        summary_ws.cell(row=1, column=13, value="improvements").font = Font(bold=True)
+    # Workbooks written before the JSONL history existed are migrated once
+    if EXCEL_PATH.exists() and not RUN_HISTORY_PATH.exists():
+        if not openpyxl_available():
+            print("Warning: openpyxl is needed to migrate the existing workbook, skipping Excel persist")
+            return
+        _seed_run_history_from_workbook(EXCEL_PATH)
 
-    # Add summary row
-    next_row = summary_ws.max_row + 1
     gemini_top = None
     opus_top = None
 
@@ -544,7 +862,7 @@ def persist_to_excel(spec: dict, synthesis: dict, comparison: dict = None):
 
     summary_data = [
         run_id,
-        datetime.now().isoformat(),
+        timestamp or datetime.now().isoformat(),
         spec["pipeline_version"],
         spec["acrue_version"],
         ", ".join(spec["styles"]),
@@ -558,43 +876,40 @@ def persist_to_excel(spec: dict, synthesis: dict, comparison: dict = None):
         improvements,
     ]
 
-    for col, value in enumerate(summary_data, 1):
-        summary_ws.cell(row=next_row, column=col, value=value)
-
-    # Create detailed sheet for this run
-    if run_id in wb.sheetnames:
-        del wb[run_id]
-
-    run_ws = wb.create_sheet(run_id)
-
-    # Header
-    run_ws.cell(row=1, column=1, value=f"Benchmark Run: {run_id}").font = Font(bold=True, size=14)
-    run_ws.cell(row=2, column=1, value=f"Winner: {synthesis['winner']}").font = Font(bold=True)
+    record = {
+        "run_id": run_id,
+        "summary": summary_data,
+        "winner": synthesis["winner"],
+        "rankings": [
+            [r["rank"], r["style"], r["gemini_rank"], r["opus_rank"], r["final_score"]]
+            for r in synthesis["rankings"]
+        ],
+    }
 
-    # Rankings table
-    run_ws.cell(row=4, column=1, value="Final Rankings").font = Font(bold=True)
-    headers = ["Rank", "Style", "Gemini Rank", "Opus Rank", "Final Score"]
-    for col, header in enumerate(headers, 1):
-        cell = run_ws.cell(row=5, column=col, value=header)
-        cell.font = Font(bold=True)
-        cell.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        cell.font = Font(bold=True, color="FFFFFF")
-
-    for i, r in enumerate(synthesis["rankings"], 6):
-        run_ws.cell(row=i, column=1, value=r["rank"])
-        run_ws.cell(row=i, column=2, value=r["style"])
-        run_ws.cell(row=i, column=3, value=r["gemini_rank"])
-        run_ws.cell(row=i, column=4, value=r["opus_rank"])
-        run_ws.cell(row=i, column=5, value=r["final_score"])
-
-    # Save
-    wb.save(EXCEL_PATH)
+    # Rebuild the workbook from history plus this run into a temp file, then
+    # swap it in. The record is only appended to history once the swap
+    # succeeds, so a failed rebuild leaves both files as they were.
+    tmp_path = EXCEL_PATH.with_name(EXCEL_PATH.name + ".tmp")
+    try:
+        if xlsxwriter_available():
+            _write_workbook_xlsxwriter(tmp_path, record)
+        else:
+            _write_workbook_openpyxl(tmp_path, record)
+        os.replace(tmp_path, EXCEL_PATH)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    _append_run_history(record)
     print(f"Persisted to Excel: {EXCEL_PATH}")
 
 
 def run_comparison(spec: dict, output_dir: Path) -> dict | None:
     """Auto-compare the current run against the most recent prior run."""
-    if not COMPARE_AVAILABLE:
+    try:
+        from compare_runs import (
+            compare_runs, print_comparison_console, save_comparison, find_latest_prior_run,
+        )
+    except ImportError:
         print("Warning: compare_runs module not available, skipping comparison")
         return None
 
@@ -628,10 +943,13 @@ def main():
 
     command = sys.argv[1].lower()
 
+    # One timestamp per invocation, shared by every artifact this command writes
+    now = datetime.now().isoformat()
+
     try:
         if command == "validate":
             spec = validate_phase1()
-            print(json.dumps(spec, indent=2))
+            _print_json(spec)
 
         elif command == "init":
             spec = load_run_spec()
@@ -643,10 +961,10 @@ def main():
             output_dir = SCRIPT_DIR / spec["output_dir"]
 
             # Load judge results
-            with open(output_dir / "gemini.json", 'r') as f:
-                gemini = json.load(f)
-            with open(output_dir / "opus.json", 'r') as f:
-                opus = json.load(f)
+            gemini, opus = _run_concurrently(
+                partial(_read_json, output_dir / "gemini.json"),
+                partial(_read_json, output_dir / "opus.json"),
+            )
 
             # Synthesize
             synthesis = synthesize_results(spec, gemini, opus)
@@ -655,13 +973,13 @@ def main():
             comparison = run_comparison(spec, output_dir)
 
             # Generate report (with comparison if available)
-            report = generate_report(spec, gemini, opus, synthesis, comparison)
+            report = generate_report(spec, gemini, opus, synthesis, comparison, timestamp=now)
 
             # Save
-            with open(output_dir / "synthesis.json", 'w') as f:
-                json.dump(synthesis, f, indent=2)
-            with open(output_dir / "report.md", 'w') as f:
-                f.write(report)
+            _run_concurrently(
+                partial(_write_json, output_dir / "synthesis.json", synthesis),
+                partial((output_dir / "report.md").write_text, report),
+            )
 
             print(f"Winner: {synthesis['winner']}")
             print(f"Report saved to: {output_dir / 'report.md'}")
@@ -670,17 +988,13 @@ def main():
             spec = load_run_spec()
             output_dir = SCRIPT_DIR / spec["output_dir"]
 
-            with open(output_dir / "synthesis.json", 'r') as f:
-                synthesis = json.load(f)
-
-            # Load comparison if it exists
-            comparison = None
-            comp_path = output_dir / "comparison.json"
-            if comp_path.exists():
-                with open(comp_path, 'r') as f:
-                    comparison = json.load(f)
+            # Load synthesis, plus comparison if it exists
+            synthesis, comparison = _run_concurrently(
+                partial(_read_json, output_dir / "synthesis.json"),
+                partial(_read_json_if_exists, output_dir / "comparison.json"),
+            )
 
-            persist_to_excel(spec, synthesis, comparison)
+            persist_to_excel(spec, synthesis, comparison, timestamp=now)
 
         elif command == "compare":
             spec = load_run_spec()
@@ -701,20 +1015,27 @@ def main():
             prompt = build_acrue_prompt(style, style_data)
             print(prompt)
 
+        elif command == "build-prompts-all":
+            # Build ACRUE prompts for every style in run_spec.json
+            spec = load_run_spec()
+            for style, prompt in build_all_prompts(spec["styles"]).items():
+                print(f"===== {style} =====")
+                print(prompt)
+
         elif command == "compute-rankings":
             # Compute rankings from acrue.json
             spec = load_run_spec()
             output_dir = SCRIPT_DIR / spec["output_dir"]
 
-            with open(output_dir / "acrue.json", 'r') as f:
-                acrue_results = json.load(f)
-
-            rankings = compute_feasibility_rankings(acrue_results)
+            acrue_results = _read_json(output_dir / "acrue.json")
 
-            with open(output_dir / "gemini.json", 'w') as f:
-                json.dump(rankings, f, indent=2)
+            rankings = compute_feasibility_rankings(acrue_results, timestamp=now)
 
-            print(json.dumps(rankings, indent=2))
+            # Serialize once; the same ASCII-escaped text goes to gemini.json
+            # and stdout (safe on any console encoding)
+            text = json.dumps(rankings, indent=2)
+            (output_dir / "gemini.json").write_text(text)
+            print(text)
 
         else:
             print(f"Unknown command: {command}")
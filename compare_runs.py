@@ -8,50 +8,211 @@ Usage:
 """
 
 import argparse
+import io
 import json
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
 from config import RUNS_DIR, get_grade, MAX_SCORE
 
+# Fast JSON (optional; stdlib json is the fallback)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Streaming JSON parser for large acrue.json files (optional)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 
 # ---------------------------------------------------------------------------
 # Data loading
 # ---------------------------------------------------------------------------
 
+def _load(path: str):
+    """Read and parse a JSON file as bytes (orjson when installed)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _dumps(obj) -> bytes:
+    """Serialize obj as 2-space indented JSON bytes (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+@lru_cache(maxsize=256)
+def _load_json_cached(path_str: str, mtime_ns: int):
+    """Parse a JSON file once per (path, mtime). Treat the result as read-only."""
+    return _load(path_str)
+
+
+def _load_cached(path: str):
+    """Load a run file, reusing the parsed result while the file is unchanged."""
+    return _load_json_cached(path, os.stat(path).st_mtime_ns)
+
+
+def _iter_acrue_entries(path: str):
+    """
+    Yield per-image entries from acrue.json one at a time.
+
+    With ijson installed the array is streamed, so memory stays flat no matter
+    how many images a run has; otherwise the whole file is parsed up front.
+    """
+    if IJSON_AVAILABLE:
+        with open(path, "rb") as f:
+            yield from ijson.items(f, "item", use_float=True)
+    else:
+        yield from _load(path)
+
+
+@lru_cache(maxsize=64)
+def _aggregate_acrue(path_str: str, mtime_ns: int) -> dict:
+    """
+    Average percentage and weighted_total per style over acrue.json.
+
+    summary can be a dict (with percentage/weighted_total) or a string, in
+    which case the values sit at the top level of the entry. Only running
+    [sum_pct, sum_wt, count] totals are kept, never the entries themselves.
+    Returns {style: (avg_pct, avg_wt)}.
+    """
+    style_sums = {}
+    # Local bindings keep attribute lookups out of the per-entry loop
+    get = dict.get
+    sums_get = style_sums.get
+    for entry in _iter_acrue_entries(path_str):
+        style = get(entry, "style", "")
+        if not style:
+            continue
+        summary = get(entry, "summary", {})
+        if not isinstance(summary, dict):
+            summary = entry
+        acc = sums_get(style)
+        if acc is None:
+            acc = style_sums[style] = [0, 0, 0]
+        acc[0] += get(summary, "percentage", 0)
+        acc[1] += get(summary, "weighted_total", 0)
+        acc[2] += 1
+
+    return {
+        style: (sum_pct / count, sum_wt / count)
+        for style, (sum_pct, sum_wt, count) in style_sums.items()
+    }
+
+
+def _load_if_exists(path: str):
+    """_load_cached, or None when the file is absent."""
+    try:
+        return _load_cached(path)
+    except FileNotFoundError:
+        return None
+
+
+def _aggregate_acrue_if_exists(path: str):
+    """_aggregate_acrue, or None when the run has no acrue.json."""
+    try:
+        return _aggregate_acrue(path, os.stat(path).st_mtime_ns)
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _read_winner_cached(path_str: str, mtime_ns: int):
+    """
+    Return the top-level "winner" of a synthesis.json.
+
+    With ijson the document is scanned key by key and parsing stops at
+    "winner" (written first by the orchestrator), so the rankings are never
+    built. Otherwise the file is parsed in full.
+    """
+    if IJSON_AVAILABLE:
+        with open(path_str, "rb") as f:
+            for key, value in ijson.kvitems(f, "", use_float=True):
+                if key == "winner":
+                    return value
+        return "N/A"
+    return _load(path_str).get("winner", "N/A")
+
+
+def _read_winner(path: str):
+    """Winner recorded in a synthesis.json, or "N/A" when the file is absent."""
+    try:
+        return _read_winner_cached(path, os.stat(path).st_mtime_ns)
+    except FileNotFoundError:
+        return "N/A"
+
+
+@lru_cache(maxsize=1)
+def _sorted_run_dirs_cached(runs_dir: str, mtime_ns: int) -> tuple:
+    """(name, path) of every run directory, sorted by name."""
+    with os.scandir(runs_dir) as it:
+        return tuple(sorted((e.name, e.path) for e in it if e.is_dir()))
+
+
+def _sorted_run_dirs() -> tuple | None:
+    """
+    Sorted run directories in RUNS_DIR, or None if RUNS_DIR does not exist.
+
+    One os.scandir pass (DirEntry.is_dir() needs no per-entry stat), reused
+    by show_history and find_latest_prior_run until a run directory is added
+    or removed (which bumps RUNS_DIR's mtime).
+    """
+    try:
+        mtime_ns = os.stat(RUNS_DIR).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _sorted_run_dirs_cached(str(RUNS_DIR), mtime_ns)
+
+
 def load_run_results(run_id: str) -> dict:
     """Load synthesis.json (preferred) or gemini.json from a run directory.
 
     Returns a dict keyed by style name with score/percentage/grade.
     """
-    run_dir = RUNS_DIR / run_id
+    # Plain string paths: these are built per file per call, and os.path.join
+    # is much cheaper than Path division.
+    run_dir = os.path.join(RUNS_DIR, run_id)
 
-    if not run_dir.exists():
+    if not os.path.exists(run_dir):
         raise FileNotFoundError(f"Run directory not found: {run_dir}")
 
-    # Try synthesis.json first (has both judge rankings merged)
-    synthesis_path = run_dir / "synthesis.json"
-    gemini_path = run_dir / "gemini.json"
-    acrue_path = run_dir / "acrue.json"
+    # The four files are independent, so read and parse them concurrently
+    # (cloud-synced run folders make each open slow on a cold cache).
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [
+            pool.submit(_load_if_exists, os.path.join(run_dir, "synthesis.json")),
+            pool.submit(_load_if_exists, os.path.join(run_dir, "gemini.json")),
+            pool.submit(_aggregate_acrue_if_exists, os.path.join(run_dir, "acrue.json")),
+            pool.submit(_load_if_exists, os.path.join(run_dir, "run_spec.json")),
+        ]
+    synthesis, gemini, averages, spec = (f.result() for f in futures)
 
     styles = {}
 
-    if synthesis_path.exists():
-        with open(synthesis_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        for r in data.get("rankings", []):
+    # synthesis.json first (has both judge rankings merged)
+    if synthesis is not None:
+        for r in synthesis.get("rankings", []):
             styles[r["style"]] = {
                 "final_score": r.get("final_score"),
                 "gemini_rank": r.get("gemini_rank"),
                 "opus_rank": r.get("opus_rank"),
             }
 
-    if gemini_path.exists():
-        with open(gemini_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        for r in data.get("rankings", []):
+    if gemini is not None:
+        for r in gemini.get("rankings", []):
             style = r["style"]
             if style not in styles:
                 styles[style] = {}
@@ -61,48 +222,17 @@ def load_run_results(run_id: str) -> dict:
                 "avg_grade": r.get("avg_grade", "N/A"),
             })
 
-    if acrue_path.exists():
-        with open(acrue_path, "r", encoding="utf-8") as f:
-            acrue_data = json.load(f)
-
-        # acrue.json is a list of per-image evaluations; aggregate by style
-        # summary can be a dict (with percentage/weighted_total) or a string
-        style_scores = {}
-        for entry in acrue_data:
-            style = entry.get("style", "")
-            if not style:
-                continue
-            summary = entry.get("summary", {})
-            if isinstance(summary, dict):
-                pct = summary.get("percentage", 0)
-                wt = summary.get("weighted_total", 0)
-                grade = summary.get("grade", "N/A")
-            else:
-                # summary is a string; percentage/grade at top level
-                pct = entry.get("percentage", 0)
-                wt = entry.get("weighted_total", 0)
-                grade = entry.get("grade", "N/A")
-            style_scores.setdefault(style, []).append({
-                "percentage": pct,
-                "weighted_total": wt,
-                "grade": grade,
-            })
-
-        for style, scores in style_scores.items():
+    if averages is not None:
+        for style, (avg_pct, avg_wt) in averages.items():
             if style not in styles:
                 styles[style] = {}
-            avg_pct = sum(s["percentage"] for s in scores) / len(scores)
-            avg_wt = sum(s["weighted_total"] for s in scores) / len(scores)
             styles[style].setdefault("avg_score", round(avg_wt, 2))
             styles[style].setdefault("avg_percentage", round(avg_pct, 1))
             styles[style].setdefault("avg_grade", get_grade(avg_pct))
 
-    # Load run_spec for metadata
-    spec_path = run_dir / "run_spec.json"
-    spec = {}
-    if spec_path.exists():
-        with open(spec_path, "r", encoding="utf-8") as f:
-            spec = json.load(f)
+    # run_spec for metadata
+    if spec is None:
+        spec = {}
 
     return {"run_id": run_id, "styles": styles, "spec": spec}
 
@@ -111,6 +241,20 @@ def load_run_results(run_id: str) -> dict:
 # Comparison logic
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=1)
+def _iso_for_second(epoch_second: int) -> str:
+    return datetime.fromtimestamp(epoch_second).isoformat(timespec="seconds")
+
+
+def _now_iso() -> str:
+    """Local time as an ISO-8601 string to the second, formatted once per second."""
+    return _iso_for_second(int(time.time()))
+
+
+_UNCHANGED, _IMPROVED, _REGRESSED = 0, 1, 2
+_STATUS_LABELS = ("unchanged", "improved", "REGRESSION")
+
+
 def compare_runs(current_id: str, baseline_id: str) -> dict:
     """Compare two runs and produce per-style deltas."""
     current = load_run_results(current_id)
@@ -118,45 +262,44 @@ def compare_runs(current_id: str, baseline_id: str) -> dict:
 
     all_styles = sorted(set(current["styles"].keys()) | set(baseline["styles"].keys()))
 
-    style_deltas = []
-    improved = 0
-    regressed = 0
-    unchanged = 0
-
-    for style in all_styles:
-        cur = current["styles"].get(style, {})
-        base = baseline["styles"].get(style, {})
-
-        cur_pct = cur.get("avg_percentage", 0)
-        base_pct = base.get("avg_percentage", 0)
-        cur_score = cur.get("avg_score", 0)
-        base_score = base.get("avg_score", 0)
-
-        delta_pct = round(cur_pct - base_pct, 1)
-        delta_score = round(cur_score - base_score, 2)
-
-        if abs(delta_pct) < 0.5:
-            status = "unchanged"
-            unchanged += 1
-        elif delta_pct > 0:
-            status = "improved"
-            improved += 1
-        else:
-            status = "REGRESSION"
-            regressed += 1
-
-        style_deltas.append({
-            "style": style,
-            "current_pct": cur_pct,
-            "baseline_pct": base_pct,
-            "delta_pct": delta_pct,
-            "current_score": cur_score,
-            "baseline_score": base_score,
-            "delta_score": delta_score,
-            "current_grade": cur.get("avg_grade", "N/A"),
-            "baseline_grade": base.get("avg_grade", "N/A"),
-            "status": status,
-        })
+    # Column-wise (one list per field) rather than one dict per style, so each
+    # step below is a tight comprehension over flat values.
+    get = dict.get
+    cur_styles = current["styles"]
+    base_styles = baseline["styles"]
+    cur_rows = [get(cur_styles, style, {}) for style in all_styles]
+    base_rows = [get(base_styles, style, {}) for style in all_styles]
+
+    cur_pct = [get(r, "avg_percentage", 0) for r in cur_rows]
+    base_pct = [get(r, "avg_percentage", 0) for r in base_rows]
+    cur_score = [get(r, "avg_score", 0) for r in cur_rows]
+    base_score = [get(r, "avg_score", 0) for r in base_rows]
+
+    delta_pct = [round(c - b, 1) for c, b in zip(cur_pct, base_pct)]
+    delta_score = [round(c - b, 2) for c, b in zip(cur_score, base_score)]
+
+    # Status code without branching: 0 when |delta| < 0.5, else 1 if the
+    # delta is positive, else 2. Indexes _STATUS_LABELS.
+    codes = [(1 - (abs(d) < 0.5)) * (2 - (d > 0)) for d in delta_pct]
+    unchanged = codes.count(_UNCHANGED)
+    improved = codes.count(_IMPROVED)
+    regressed = codes.count(_REGRESSED)
+
+    style_deltas = [
+        {
+            "style": all_styles[i],
+            "current_pct": cur_pct[i],
+            "baseline_pct": base_pct[i],
+            "delta_pct": delta_pct[i],
+            "current_score": cur_score[i],
+            "baseline_score": base_score[i],
+            "delta_score": delta_score[i],
+            "current_grade": get(cur_rows[i], "avg_grade", "N/A"),
+            "baseline_grade": get(base_rows[i], "avg_grade", "N/A"),
+            "status": _STATUS_LABELS[codes[i]],
+        }
+        for i in range(len(all_styles))
+    ]
 
     if regressed > 0:
         verdict = "REGRESSION_DETECTED"
@@ -168,7 +311,7 @@ def compare_runs(current_id: str, baseline_id: str) -> dict:
     return {
         "current_run_id": current_id,
         "baseline_run_id": baseline_id,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now_iso(),
         "styles": style_deltas,
         "summary": {
             "improved": improved,
@@ -183,56 +326,70 @@ def compare_runs(current_id: str, baseline_id: str) -> dict:
 # Report generation
 # ---------------------------------------------------------------------------
 
+# Row fields used by the report and console output, in table order. Pulling
+# them into tuples up front keeps the formatting loops to tuple indexing and
+# %-formatting, which CPython 3.13's JIT and PyPy specialize well.
+_ROW_FIELDS = itemgetter(
+    "style", "baseline_pct", "baseline_grade", "current_pct", "current_grade",
+    "delta_pct", "status",
+)
+_CONSOLE_TAGS = {"improved": "IMPROVED", "REGRESSION": "REGRESSION"}
+
+_COMPARISON_HEADER = """\
+# Comparison: {current_run_id} vs {baseline_run_id}
+
+Generated: {timestamp}
+
+## Per-Style Deltas
+
+| Style | Baseline | Current | Delta | Status |
+|-------|----------|---------|-------|--------|
+"""
+
+_COMPARISON_VERDICT = """\
+
+## Verdict
+
+- Improved: {improved}
+- Regressed: {regressed}
+- Unchanged: {unchanged}
+- **Overall: {overall_verdict}**
+"""
+
+
 def generate_comparison_report(comparison: dict) -> str:
     """Produce a human-readable markdown comparison."""
-    lines = [
-        f"# Comparison: {comparison['current_run_id']} vs {comparison['baseline_run_id']}",
-        "",
-        f"Generated: {comparison['timestamp']}",
-        "",
-        "## Per-Style Deltas",
-        "",
-        "| Style | Baseline | Current | Delta | Status |",
-        "|-------|----------|---------|-------|--------|",
-    ]
+    buf = io.StringIO()
+    buf.write(_COMPARISON_HEADER.format_map(comparison))
 
-    for s in comparison["styles"]:
-        sign = "+" if s["delta_pct"] > 0 else ""
-        flag = " REGRESSION" if s["status"] == "REGRESSION" else ""
-        lines.append(
-            f"| {s['style']} | {s['baseline_pct']:.1f}% ({s['baseline_grade']}) "
-            f"| {s['current_pct']:.1f}% ({s['current_grade']}) "
-            f"| {sign}{s['delta_pct']:.1f}% | {s['status']}{flag} |"
-        )
+    # Unpack each row to a flat tuple once, format each table column in its
+    # own pass with %-formatting, then stitch rows with one join
+    rows = [_ROW_FIELDS(s) for s in comparison["styles"]]
+    baseline_cells = ["%.1f%% (%s)" % (r[1], r[2]) for r in rows]
+    current_cells = ["%.1f%% (%s)" % (r[3], r[4]) for r in rows]
+    delta_cells = ["%s%.1f%%" % ("+" if r[5] > 0 else "", r[5]) for r in rows]
+    status_cells = [r[6] + (" REGRESSION" if r[6] == "REGRESSION" else "") for r in rows]
+    buf.write("".join(
+        "| %s | %s | %s | %s | %s |\n" % (r[0], b, c, d, st)
+        for r, b, c, d, st in zip(rows, baseline_cells, current_cells, delta_cells, status_cells)
+    ))
 
-    summary = comparison["summary"]
-    lines.extend([
-        "",
-        "## Verdict",
-        "",
-        f"- Improved: {summary['improved']}",
-        f"- Regressed: {summary['regressed']}",
-        f"- Unchanged: {summary['unchanged']}",
-        f"- **Overall: {summary['overall_verdict']}**",
-        "",
-    ])
+    buf.write(_COMPARISON_VERDICT.format_map(comparison["summary"]))
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def print_comparison_console(comparison: dict) -> None:
     """Print a concise console summary."""
     print()
     print(f"=== COMPARISON vs {comparison['baseline_run_id']} ===")
-    for s in comparison["styles"]:
-        sign = "+" if s["delta_pct"] > 0 else ""
-        tag = "IMPROVED" if s["status"] == "improved" else (
-            "REGRESSION" if s["status"] == "REGRESSION" else "UNCHANGED"
-        )
-        print(
-            f"  {s['style']:<15} {s['baseline_pct']:5.1f}% -> {s['current_pct']:5.1f}%  "
-            f"({sign}{s['delta_pct']:.1f}%)  {tag}"
-        )
+    rows = map(_ROW_FIELDS, comparison["styles"])
+    for style, base_pct, _, cur_pct, _, delta_pct, status in rows:
+        print("  %-15s %5.1f%% -> %5.1f%%  (%s%.1f%%)  %s" % (
+            style, base_pct, cur_pct,
+            "+" if delta_pct > 0 else "", delta_pct,
+            _CONSOLE_TAGS.get(status, "UNCHANGED"),
+        ))
 
     summary = comparison["summary"]
     print()
@@ -251,8 +408,9 @@ def save_comparison(comparison: dict, output_dir: Path = None) -> Path:
     output_dir.mkdir(parents=True, exist_ok=True)
 
     out_path = output_dir / "comparison.json"
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(comparison, f, indent=2)
+    data = _dumps(comparison)
+    with open(out_path, "wb") as f:
+        f.write(data)
     print(f"Comparison saved to: {out_path}")
     return out_path
 
@@ -263,38 +421,32 @@ def save_comparison(comparison: dict, output_dir: Path = None) -> Path:
 
 def show_history() -> None:
     """Show all runs chronologically."""
-    if not RUNS_DIR.exists():
+    all_dirs = _sorted_run_dirs()
+    if all_dirs is None:
         print("No runs directory found.")
         return
 
-    run_dirs = sorted(
-        [d for d in RUNS_DIR.iterdir() if d.is_dir() and (d / "run_spec.json").exists()],
-        key=lambda d: d.name,
-    )
+    # One cached load per run_spec.json; runs without one are skipped
+    runs = []
+    for name, path in all_dirs:
+        spec = _load_if_exists(os.path.join(path, "run_spec.json"))
+        if spec is not None:
+            runs.append((name, path, spec))
 
-    if not run_dirs:
+    if not runs:
         print("No completed runs found.")
         return
 
     print(f"\n{'Run ID':<40} {'Styles':<30} {'Winner':<15}")
     print("-" * 85)
 
-    for rd in run_dirs:
-        spec_path = rd / "run_spec.json"
-        with open(spec_path, "r", encoding="utf-8") as f:
-            spec = json.load(f)
-
+    for name, path, spec in runs:
         styles = ", ".join(spec.get("styles", []))
 
         # Try to get winner from synthesis
-        winner = "N/A"
-        synthesis_path = rd / "synthesis.json"
-        if synthesis_path.exists():
-            with open(synthesis_path, "r", encoding="utf-8") as f:
-                syn = json.load(f)
-            winner = syn.get("winner", "N/A")
+        winner = _read_winner(os.path.join(path, "synthesis.json"))
 
-        print(f"  {spec.get('run_id', rd.name):<38} {styles:<30} {winner:<15}")
+        print(f"  {spec.get('run_id', name):<38} {styles:<30} {winner:<15}")
 
     print()
 
@@ -305,14 +457,14 @@ def show_history() -> None:
 
 def find_latest_prior_run(current_run_id: str) -> str | None:
     """Find the most recent run before the current one (by directory name sort)."""
-    if not RUNS_DIR.exists():
+    run_dirs = _sorted_run_dirs()
+    if run_dirs is None:
         return None
 
-    run_dirs = sorted(
-        [d.name for d in RUNS_DIR.iterdir() if d.is_dir() and d.name != current_run_id],
-    )
-
-    return run_dirs[-1] if run_dirs else None
+    for name, _ in reversed(run_dirs):
+        if name != current_run_id:
+            return name
+    return None
 
 
 # ---------------------------------------------------------------------------
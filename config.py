@@ -7,6 +7,7 @@ Environment variables override defaults where applicable.
 """
 
 import os
+from bisect import bisect_right
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
@@ -32,6 +33,7 @@ ACRUE_V3_PROMPT_PATH = PROJECT_ROOT / "rubrics" / "acrue_v3_prompt.md"
 RUN_SPEC_PATH = PROJECT_ROOT / "run_spec.json"
 AUTH_STATE_PATH = PROJECT_ROOT / "auth_state.json"
 EXCEL_PATH = PROJECT_ROOT / "ai_restyle_benchmark.xlsx"
+RUN_HISTORY_PATH = PROJECT_ROOT / "runs.jsonl"
 
 # ---------------------------------------------------------------------------
 # Environment variables
@@ -53,30 +55,39 @@ WEIGHTS = {
 
 MAX_SCORE = 25.0
 
-GRADE_THRESHOLDS = {
-    "A+": 90,
-    "A": 80,
-    "B": 70,
-    "C": 60,
-    "F": 0,
-}
+# (grade, minimum percentage), highest first. The floor grade must come last.
+_GRADE_TABLE = (
+    ("A+", 90),
+    ("A", 80),
+    ("B", 70),
+    ("C", 60),
+    ("F", 0),
+)
+
+GRADE_THRESHOLDS = dict(_GRADE_TABLE)
 
 # ---------------------------------------------------------------------------
 # Style presets
 # ---------------------------------------------------------------------------
-STYLE_PRESETS = [
+STYLE_PRESETS = (
     "Movie Poster", "Plush Toy", "Anime", "Chibi Sticker", "Caricature",
     "Superhero", "Toy Model", "Graffiti", "Crochet Art", "Doodle",
     "Pencil Portrait", "Storybook", "Photo Booth", "Pop Art",
-]
+)
+
+
+# Ascending cutoffs above the floor grade, and the letter for each bisect slot:
+# get_grade(p) == _GRADE_LETTERS[number of cutoffs <= p].
+_GRADE_CUTOFFS = tuple(threshold for _, threshold in reversed(_GRADE_TABLE[:-1]))
+_GRADE_LETTERS = tuple(grade for grade, _ in reversed(_GRADE_TABLE))
 
 
 def get_grade(percentage: float) -> str:
     """Return letter grade for a percentage score."""
-    for grade, threshold in GRADE_THRESHOLDS.items():
-        if percentage >= threshold:
-            return grade
-    return "F"
+    # Written as `not >=` so NaN gets the floor grade, as the threshold scan did
+    if not percentage >= _GRADE_CUTOFFS[0]:
+        return _GRADE_LETTERS[0]
+    return _GRADE_LETTERS[bisect_right(_GRADE_CUTOFFS, percentage)]
 
 
 # ---------------------------------------------------------------------------
@@ -99,6 +110,7 @@ if __name__ == "__main__":
     print(f"  RUN_SPEC_PATH:         {RUN_SPEC_PATH}")
     print(f"  AUTH_STATE_PATH:       {AUTH_STATE_PATH}")
     print(f"  EXCEL_PATH:            {EXCEL_PATH}")
+    print(f"  RUN_HISTORY_PATH:      {RUN_HISTORY_PATH}")
     print(f"  GEMINI_API_KEY:        {'(set)' if GEMINI_API_KEY else '(not set)'}")
     print(f"  GEMINI_MODEL:          {GEMINI_MODEL}")
     print(f"  ANTHROPIC_API_KEY:     {'(set)' if ANTHROPIC_API_KEY else '(not set)'}")
@@ -2,29 +2,78 @@
 Create the AI Restyle Benchmark Excel ledger.
 """
 import os
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
 
-def create_benchmark_ledger():
-    """Create the initial benchmark ledger Excel file."""
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Summary"
-
-    # Define headers
-    headers = [
-        "run_id",
-        "timestamp",
-        "pipeline_version",
-        "acrue_version",
-        "styles",
-        "image_count",
-        "winner",
-        "gemini_top",
-        "opus_top",
-        "artifacts_path"
-    ]
+# xlsxwriter writes the file in one streaming pass (preferred); openpyxl is
+# the fallback.
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+# Define headers
+HEADERS = [
+    "run_id",
+    "timestamp",
+    "pipeline_version",
+    "acrue_version",
+    "styles",
+    "image_count",
+    "winner",
+    "gemini_top",
+    "opus_top",
+    "artifacts_path"
+]
+
+# Column widths, in header order
+COLUMN_WIDTHS = {
+    "A": 30,  # run_id
+    "B": 22,  # timestamp
+    "C": 16,  # pipeline_version
+    "D": 14,  # acrue_version
+    "E": 35,  # styles
+    "F": 12,  # image_count
+    "G": 15,  # winner
+    "H": 15,  # gemini_top
+    "I": 15,  # opus_top
+    "J": 45,  # artifacts_path
+}
+
+
+def _write_ledger_xlsxwriter(output_path):
+    """Write the ledger with xlsxwriter (header format is registered once)."""
+    wb = xlsxwriter.Workbook(output_path)
+    ws = wb.add_worksheet("Summary")
+
+    header_format = wb.add_format({
+        "bold": True,
+        "font_color": "#FFFFFF",
+        "bg_color": "#4472C4",
+        "align": "center",
+        "valign": "vcenter",
+        "border": 1,
+    })
+    ws.write_row(0, 0, HEADERS, header_format)
+
+    for col, width in enumerate(COLUMN_WIDTHS.values()):
+        ws.set_column(col, col, width)
+
+    # Freeze header row
+    ws.freeze_panes(1, 0)
+
+    wb.close()
+
+
+def _write_ledger_openpyxl(output_path):
+    """Write the ledger with a write-only openpyxl workbook."""
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+
+    # Write-only mode streams rows straight to XML instead of building the
+    # in-memory cell model.
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Summary")
 
     # Style definitions
     header_font = Font(bold=True, color="FFFFFF")
@@ -37,37 +86,33 @@ def create_benchmark_ledger():
         bottom=Side(style='thin')
     )
 
-    # Write headers
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
+    def header_cell(value):
+        cell = WriteOnlyCell(ws, value=value)
         cell.font = header_font
         cell.fill = header_fill
         cell.alignment = header_alignment
         cell.border = thin_border
+        return cell
 
-    # Set column widths
-    column_widths = {
-        "A": 30,  # run_id
-        "B": 22,  # timestamp
-        "C": 16,  # pipeline_version
-        "D": 14,  # acrue_version
-        "E": 35,  # styles
-        "F": 12,  # image_count
-        "G": 15,  # winner
-        "H": 15,  # gemini_top
-        "I": 15,  # opus_top
-        "J": 45,  # artifacts_path
-    }
-
-    for col_letter, width in column_widths.items():
+    for col_letter, width in COLUMN_WIDTHS.items():
         ws.column_dimensions[col_letter].width = width
 
     # Freeze header row
     ws.freeze_panes = "A2"
 
-    # Save the workbook
-    output_path = os.path.join(os.path.dirname(__file__), "ai_restyle_benchmark.xlsx")
+    # Sheet layout must be set before the first row is streamed
+    ws.append([header_cell(h) for h in HEADERS])
+
     wb.save(output_path)
+
+
+def create_benchmark_ledger():
+    """Create the initial benchmark ledger Excel file."""
+    output_path = os.path.join(os.path.dirname(__file__), "ai_restyle_benchmark.xlsx")
+    if XLSXWRITER_AVAILABLE:
+        _write_ledger_xlsxwriter(output_path)
+    else:
+        _write_ledger_openpyxl(output_path)
     print(f"Created benchmark ledger at: {output_path}")
     return output_path
 
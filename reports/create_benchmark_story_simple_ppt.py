@@ -3,482 +3,721 @@ Create Benchmark Story PowerPoint - Simple/End-User Version
 Plain language that anyone can understand
 """
 
+import hashlib
+import io
+import os
+import re
+import shutil
+from copy import deepcopy
+from xml.sax.saxutils import escape
+from weakref import WeakKeyDictionary
+
+from lxml import etree
+import pptx
 from pptx import Presentation
+from pptx.oxml import element_class_lookup
+from pptx.oxml.ns import nsdecls, qn
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
-from pptx.enum.shapes import MSO_SHAPE
 from datetime import datetime
 
 RgbColor = RGBColor
 
+# EMU lengths and colors used by the slide helpers, converted once at import
+_IN_0 = Inches(0)
+_IN_0_4 = Inches(0.4)
+_IN_0_5 = Inches(0.5)
+_IN_0_8 = Inches(0.8)
+_IN_1 = Inches(1)
+_IN_1_1 = Inches(1.1)
+_IN_1_2 = Inches(1.2)
+_IN_1_3 = Inches(1.3)
+_IN_1_4 = Inches(1.4)
+_IN_1_5 = Inches(1.5)
+_IN_1_6 = Inches(1.6)
+_IN_1_9 = Inches(1.9)
+_IN_2 = Inches(2)
+_IN_2_5 = Inches(2.5)
+_IN_3 = Inches(3)
+_IN_4 = Inches(4)
+_IN_4_2 = Inches(4.2)
+_IN_5 = Inches(5)
+_IN_5_3 = Inches(5.3)
+_IN_5_5 = Inches(5.5)
+_IN_7_5 = Inches(7.5)
+_IN_8 = Inches(8)
+_IN_9 = Inches(9)
+_IN_10 = Inches(10)
+_PT_18 = Pt(18)
+_PT_20 = Pt(20)
+_PT_22 = Pt(22)
+_PT_24 = Pt(24)
+_PT_32 = Pt(32)
+_PT_44 = Pt(44)
+_PT_48 = Pt(48)
+_RGB_TITLE = RgbColor(0, 51, 102)
+_RGB_GRAY = RgbColor(100, 100, 100)
+_RGB_ACCENT = RgbColor(0, 120, 215)
+_RGB_WHITE = RgbColor(255, 255, 255)
+
+# Parser for this script's own XML templates: python-pptx's parser options and
+# element classes, minus xml:id collection (the templates carry no IDs).
+# python-pptx's shared parser is left untouched.
+_TEMPLATE_PARSER = etree.XMLParser(
+    remove_blank_text=True, resolve_entities=False, collect_ids=False
+)
+_TEMPLATE_PARSER.set_element_class_lookup(element_class_lookup)
+
+def _parse_template(xml):
+    """Parse one of this module's XML templates into python-pptx oxml elements."""
+    return etree.fromstring(xml, _TEMPLATE_PARSER)
+
+# Clark-notation DrawingML tags, resolved once instead of qn() per bullet
+_A_BODYPR = qn("a:bodyPr")
+_A_P = qn("a:p")
+_A_R = qn("a:r")
+_A_T = qn("a:t")
+_A_R_T = f"{_A_R}/{_A_T}"  # path to a paragraph's first run text
+
+# Line breaks and other control characters need python-pptx's text handling
+# (<a:br/> for "\n", escaping for the rest)
+_CONTROL_CHAR_RE = re.compile(r"[\x00-\x1f]")
+
+# Pre-built (text, spacer) bullet paragraphs keyed by (font size pt, space after pt)
+_BULLET_TEMPLATES = {}
+
+def _bullet_templates(size_pt, space_after_pt):
+    """Return the cached text and spacer <a:p> for a bullet style."""
+    key = (size_pt, space_after_pt)
+    templates = _BULLET_TEMPLATES.get(key)
+    if templates is None:
+        ppr = (
+            f'<a:pPr><a:spcAft><a:spcPts val="{space_after_pt * 100}"/></a:spcAft>'
+            f'<a:defRPr sz="{size_pt * 100}"/></a:pPr>'
+        )
+        templates = _BULLET_TEMPLATES[key] = (
+            _parse_template(f'<a:p {nsdecls("a")}>{ppr}<a:r><a:t/></a:r></a:p>'),
+            # "" items are spacer rows: same spacing, no run
+            _parse_template(f'<a:p {nsdecls("a")}>{ppr}</a:p>'),
+        )
+    return templates
+
+def _wrapped_text_frame(textbox):
+    """Return a new textbox's text frame with word wrap turned on.
+
+    Sets wrap="square" on the <a:bodyPr> add_textbox() created, skipping the
+    word_wrap property setter.
+    """
+    tf = textbox.text_frame
+    tf._txBody.find(_A_BODYPR).set("wrap", "square")
+    return tf
+
+def _fill_bullets(tf, items, size_pt, space_after_pt):
+    """Write one paragraph per item by cloning a cached <a:p> template.
+
+    Empty items become run-less spacer paragraphs, as p.text = "" would.
+    Items with control characters are filled in by python-pptx instead.
+    """
+    if not items:
+        return
+    txBody = tf._txBody
+    # Drop the empty paragraph add_textbox() starts with, so every item takes
+    # the same path (no first-paragraph special case)
+    txBody.remove(txBody.find(_A_P))
+    template, spacer = _bullet_templates(size_pt, space_after_pt)
+    paragraphs = []
+    for item in items:
+        if not item:
+            paragraphs.append(deepcopy(spacer))
+            continue
+        if _CONTROL_CHAR_RE.search(item):
+            p = deepcopy(spacer)
+            p.append_text(item)
+        else:
+            p = deepcopy(template)
+            p.find(_A_R_T).text = item
+        paragraphs.append(p)
+    # <a:p> is the last child type of <a:txBody>, so one extend() places them all
+    txBody.extend(paragraphs)
+
+# Blank layout (index 6) per presentation part, so SlideLayouts is indexed once
+_BLANK_LAYOUTS = WeakKeyDictionary()
+
+def _add_blank_slide(prs):
+    """Add a slide with the blank layout."""
+    layout = _BLANK_LAYOUTS.get(prs.part)
+    if layout is None:
+        layout = _BLANK_LAYOUTS[prs.part] = prs.slide_layouts[6]
+    return prs.slides.add_slide(layout)
+
+# Section divider shapes: a full-bleed filled rectangle (id 2) and a centered
+# 48pt bold white title (id 3), as add_shape/add_textbox would produce them
+_SECTION_SHAPES_XML = (
+    f'<p:spTree {nsdecls("a", "p")}>'
+    '<p:sp><p:nvSpPr><p:cNvPr id="2" name="Rectangle 1"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    f'<p:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="{_IN_10}" cy="{_IN_7_5}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom>'
+    '<a:solidFill><a:srgbClr val="{color}"/></a:solidFill><a:ln><a:noFill/></a:ln></p:spPr>'
+    '<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+    '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style>'
+    '<p:txBody><a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/><a:p><a:pPr algn="ctr"/></a:p></p:txBody></p:sp>'
+    '<p:sp><p:nvSpPr><p:cNvPr id="3" name="TextBox 2"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    f'<p:spPr><a:xfrm><a:off x="{_IN_0_5}" y="{_IN_3}"/><a:ext cx="{_IN_9}" cy="{_IN_1_5}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="none"><a:spAutoFit/></a:bodyPr><a:lstStyle/>'
+    f'<a:p><a:pPr algn="ctr"><a:defRPr sz="{_PT_48.centipoints}" b="1">'
+    f'<a:solidFill><a:srgbClr val="{_RGB_WHITE}"/></a:solidFill></a:defRPr></a:pPr>'
+    '{runs}</a:p></p:txBody></p:sp>'
+    '</p:spTree>'
+)
+
+def _add_header_title(slide, text):
+    """Add the left-aligned 32pt bold title used at the top of content slides."""
+    p = slide.shapes.add_textbox(_IN_0_5, _IN_0_4, _IN_9, _IN_0_8).text_frame.paragraphs[0]
+    p.text = text
+    font = p.font
+    font.size = _PT_32
+    font.bold = True
+    font.color.rgb = _RGB_TITLE
+
 def add_title_slide(prs, title, subtitle):
     """Add a title slide."""
-    slide_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(slide_layout)
+    slide = _add_blank_slide(prs)
+    add_textbox = slide.shapes.add_textbox
 
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(2.5), Inches(9), Inches(1.5))
+    title_box = add_textbox(_IN_0_5, _IN_2_5, _IN_9, _IN_1_5)
     tf = title_box.text_frame
     p = tf.paragraphs[0]
     p.text = title
-    p.font.size = Pt(44)
-    p.font.bold = True
-    p.font.color.rgb = RgbColor(0, 51, 102)
+    font = p.font
+    font.size = _PT_44
+    font.bold = True
+    font.color.rgb = _RGB_TITLE
     p.alignment = PP_ALIGN.CENTER
 
-    subtitle_box = slide.shapes.add_textbox(Inches(0.5), Inches(4), Inches(9), Inches(1))
+    subtitle_box = add_textbox(_IN_0_5, _IN_4, _IN_9, _IN_1)
     tf = subtitle_box.text_frame
     p = tf.paragraphs[0]
     p.text = subtitle
-    p.font.size = Pt(24)
-    p.font.color.rgb = RgbColor(100, 100, 100)
+    font = p.font
+    font.size = _PT_24
+    font.color.rgb = _RGB_GRAY
     p.alignment = PP_ALIGN.CENTER
 
     return slide
 
 def add_section_slide(prs, title, color=(0, 120, 215)):
     """Add a section divider slide."""
-    slide_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(slide_layout)
+    slide = _add_blank_slide(prs)
 
-    shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(0), Inches(0), Inches(10), Inches(7.5))
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = RgbColor(*color)
-    shape.line.fill.background()
-
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(3), Inches(9), Inches(1.5))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = title
-    p.font.size = Pt(48)
-    p.font.bold = True
-    p.font.color.rgb = RgbColor(255, 255, 255)
-    p.alignment = PP_ALIGN.CENTER
+    # Static geometry: parse both shapes from the template in one go rather
+    # than building them through the shape/fill/font proxies
+    runs = "<a:br/>".join(
+        f"<a:r><a:t>{escape(line)}</a:t></a:r>" if line else ""
+        for line in title.split("\n")
+    )
+    shapes = _parse_template(_SECTION_SHAPES_XML.format(color=str(RgbColor(*color)), runs=runs))
+    slide.shapes._spTree.extend(list(shapes))
 
     return slide
 
 def add_content_slide(prs, title, bullets, subtitle=None):
     """Add a content slide with bullets."""
-    slide_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(slide_layout)
+    slide = _add_blank_slide(prs)
+    add_textbox = slide.shapes.add_textbox
 
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.4), Inches(9), Inches(0.8))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = title
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = RgbColor(0, 51, 102)
+    _add_header_title(slide, title)
 
-    y_offset = 1.2
+    y_offset = _IN_1_2
     if subtitle:
-        sub_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.1), Inches(9), Inches(0.5))
+        sub_box = add_textbox(_IN_0_5, _IN_1_1, _IN_9, _IN_0_5)
         tf = sub_box.text_frame
         p = tf.paragraphs[0]
         p.text = subtitle
-        p.font.size = Pt(18)
-        p.font.italic = True
-        p.font.color.rgb = RgbColor(100, 100, 100)
-        y_offset = 1.6
-
-    content_box = slide.shapes.add_textbox(Inches(0.5), Inches(y_offset), Inches(9), Inches(5.5))
-    tf = content_box.text_frame
-    tf.word_wrap = True
-
-    for i, bullet in enumerate(bullets):
-        if i == 0:
-            p = tf.paragraphs[0]
-        else:
-            p = tf.add_paragraph()
-        p.text = bullet
-        p.font.size = Pt(22)
-        p.space_after = Pt(14)
-        p.level = 0
+        font = p.font
+        font.size = _PT_18
+        font.italic = True
+        font.color.rgb = _RGB_GRAY
+        y_offset = _IN_1_6
+
+    content_box = add_textbox(_IN_0_5, y_offset, _IN_9, _IN_5_5)
+    tf = _wrapped_text_frame(content_box)
+    _fill_bullets(tf, bullets, 22, 14)
 
     return slide
 
 def add_two_column_slide(prs, title, left_items, right_items, left_title="", right_title=""):
     """Add a two-column comparison slide."""
-    slide_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(slide_layout)
+    slide = _add_blank_slide(prs)
+    add_textbox = slide.shapes.add_textbox
 
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.4), Inches(9), Inches(0.8))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = title
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = RgbColor(0, 51, 102)
+    _add_header_title(slide, title)
 
     if left_title:
-        left_title_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.3), Inches(4.2), Inches(0.5))
+        left_title_box = add_textbox(_IN_0_5, _IN_1_3, _IN_4_2, _IN_0_5)
         tf = left_title_box.text_frame
         p = tf.paragraphs[0]
         p.text = left_title
-        p.font.size = Pt(22)
-        p.font.bold = True
-        p.font.color.rgb = RgbColor(0, 120, 215)
+        font = p.font
+        font.size = _PT_22
+        font.bold = True
+        font.color.rgb = _RGB_ACCENT
 
     if right_title:
-        right_title_box = slide.shapes.add_textbox(Inches(5.3), Inches(1.3), Inches(4.2), Inches(0.5))
+        right_title_box = add_textbox(_IN_5_3, _IN_1_3, _IN_4_2, _IN_0_5)
         tf = right_title_box.text_frame
         p = tf.paragraphs[0]
         p.text = right_title
-        p.font.size = Pt(22)
-        p.font.bold = True
-        p.font.color.rgb = RgbColor(0, 120, 215)
-
-    y_start = 1.9 if left_title else 1.4
-
-    left_box = slide.shapes.add_textbox(Inches(0.5), Inches(y_start), Inches(4.2), Inches(5))
-    tf = left_box.text_frame
-    tf.word_wrap = True
-    for i, item in enumerate(left_items):
-        if i == 0:
-            p = tf.paragraphs[0]
-        else:
-            p = tf.add_paragraph()
-        p.text = item
-        p.font.size = Pt(18)
-        p.space_after = Pt(10)
-
-    right_box = slide.shapes.add_textbox(Inches(5.3), Inches(y_start), Inches(4.2), Inches(5))
-    tf = right_box.text_frame
-    tf.word_wrap = True
-    for i, item in enumerate(right_items):
-        if i == 0:
-            p = tf.paragraphs[0]
-        else:
-            p = tf.add_paragraph()
-        p.text = item
-        p.font.size = Pt(18)
-        p.space_after = Pt(10)
+        font = p.font
+        font.size = _PT_22
+        font.bold = True
+        font.color.rgb = _RGB_ACCENT
+
+    y_start = _IN_1_9 if left_title else _IN_1_4
+
+    left_box = add_textbox(_IN_0_5, y_start, _IN_4_2, _IN_5)
+    tf = _wrapped_text_frame(left_box)
+    _fill_bullets(tf, left_items, 18, 10)
+
+    right_box = add_textbox(_IN_5_3, y_start, _IN_4_2, _IN_5)
+    tf = _wrapped_text_frame(right_box)
+    _fill_bullets(tf, right_items, 18, 10)
 
     return slide
 
 def add_big_quote_slide(prs, quote, attribution=""):
     """Add a big quote slide."""
-    slide_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(slide_layout)
+    slide = _add_blank_slide(prs)
+    add_textbox = slide.shapes.add_textbox
 
-    quote_box = slide.shapes.add_textbox(Inches(1), Inches(2), Inches(8), Inches(3))
-    tf = quote_box.text_frame
-    tf.word_wrap = True
+    quote_box = add_textbox(_IN_1, _IN_2, _IN_8, _IN_3)
+    tf = _wrapped_text_frame(quote_box)
     p = tf.paragraphs[0]
     p.text = f'"{quote}"'
-    p.font.size = Pt(32)
-    p.font.italic = True
-    p.font.color.rgb = RgbColor(0, 51, 102)
+    font = p.font
+    font.size = _PT_32
+    font.italic = True
+    font.color.rgb = _RGB_TITLE
     p.alignment = PP_ALIGN.CENTER
 
     if attribution:
-        attr_box = slide.shapes.add_textbox(Inches(1), Inches(5), Inches(8), Inches(0.5))
+        attr_box = add_textbox(_IN_1, _IN_5, _IN_8, _IN_0_5)
         tf = attr_box.text_frame
         p = tf.paragraphs[0]
         p.text = f"— {attribution}"
-        p.font.size = Pt(20)
-        p.font.color.rgb = RgbColor(100, 100, 100)
+        font = p.font
+        font.size = _PT_20
+        font.color.rgb = _RGB_GRAY
         p.alignment = PP_ALIGN.CENTER
 
     return slide
 
 def add_emoji_content_slide(prs, title, items_with_emoji):
     """Add a content slide with emoji bullets for visual appeal."""
-    slide_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(slide_layout)
+    slide = _add_blank_slide(prs)
 
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.4), Inches(9), Inches(0.8))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = title
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = RgbColor(0, 51, 102)
+    _add_header_title(slide, title)
 
-    content_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.3), Inches(9), Inches(5.5))
-    tf = content_box.text_frame
-    tf.word_wrap = True
-
-    for i, item in enumerate(items_with_emoji):
-        if i == 0:
-            p = tf.paragraphs[0]
-        else:
-            p = tf.add_paragraph()
-        p.text = item
-        p.font.size = Pt(24)
-        p.space_after = Pt(16)
+    content_box = slide.shapes.add_textbox(_IN_0_5, _IN_1_3, _IN_9, _IN_5_5)
+    tf = _wrapped_text_frame(content_box)
+    _fill_bullets(tf, items_with_emoji, 24, 16)
 
     return slide
 
-def create_presentation():
-    """Create the simplified presentation."""
-    prs = Presentation()
-    prs.slide_width = Inches(10)
-    prs.slide_height = Inches(7.5)
-
-    # ===== TITLE =====
-    add_title_slide(
-        prs,
-        "How Do We Know Which\nAI Style is Best?",
-        "A smart way to test OneDrive's photo magic\n" + datetime.now().strftime("%B %d, %Y")
-    )
-
+# Deck content after the title slide, in order: (slide kind, builder kwargs)
+SLIDES = [
     # ===== THE STORY BEGINS =====
-    add_section_slide(prs, "The Story", (0, 51, 102))
-
-    add_content_slide(prs, "You Know That Cool Feature?", [
-        "OneDrive Photos can transform your photos",
-        "into amazing artwork with AI",
-        "",
-        "Turn yourself into an anime character",
-        "Look like a Warhol painting",
-        "Become a storybook illustration",
-        "",
-        "But which style do people love most?"
-    ])
-
-    add_big_quote_slide(
-        prs,
-        "Which style should we show first to users?",
-        "The question we needed to answer"
-    )
-
-    add_content_slide(prs, "The Old Way: Opinions", [
-        "Before, we'd ask around:",
-        "",
-        '"I think Anime looks cool"',
-        '"My favorite is Pop Art"',
-        '"Storybook feels warmer to me"',
-        "",
-        "Everyone had different opinions!",
-        "No way to know who was right."
-    ])
-
-    add_content_slide(prs, "The New Way: Let AI Be the Judge", [
-        "What if we could test this fairly?",
-        "",
-        "Take real photos",
-        "Apply each style",
-        "Have AI judges score them",
-        "Pick the winner based on data",
-        "",
-        "That's exactly what we built!"
-    ])
+    ("section", {
+        "title": "The Story",
+        "color": (0, 51, 102),
+    }),
+    ("content", {
+        "title": "You Know That Cool Feature?",
+        "bullets": [
+            "OneDrive Photos can transform your photos",
+            "into amazing artwork with AI",
+            "",
+            "Turn yourself into an anime character",
+            "Look like a Warhol painting",
+            "Become a storybook illustration",
+            "",
+            "But which style do people love most?",
+        ],
+    }),
+    ("quote", {
+        "quote": "Which style should we show first to users?",
+        "attribution": "The question we needed to answer",
+    }),
+    ("content", {
+        "title": "The Old Way: Opinions",
+        "bullets": [
+            "Before, we'd ask around:",
+            "",
+            '"I think Anime looks cool"',
+            '"My favorite is Pop Art"',
+            '"Storybook feels warmer to me"',
+            "",
+            "Everyone had different opinions!",
+            "No way to know who was right.",
+        ],
+    }),
+    ("content", {
+        "title": "The New Way: Let AI Be the Judge",
+        "bullets": [
+            "What if we could test this fairly?",
+            "",
+            "Take real photos",
+            "Apply each style",
+            "Have AI judges score them",
+            "Pick the winner based on data",
+            "",
+            "That's exactly what we built!",
+        ],
+    }),
 
     # ===== HOW IT WORKS =====
-    add_section_slide(prs, "How It Works", (0, 120, 215))
-
-    add_content_slide(prs, "Think of It Like a Cooking Show", [
-        "Same ingredients (3 photos)",
-        "Different recipes (3 styles)",
-        "Expert judges score each dish",
-        "Best overall score wins!",
-        "",
-        "Fair, consistent, no favoritism"
-    ], subtitle="A competition with clear rules")
-
-    add_emoji_content_slide(prs, "The Contestants", [
-        "ANIME",
-        "Big eyes, bright colors, that cool Japanese cartoon look",
-        "",
-        "POP ART",
-        "Bold colors, dots like comic books, museum-worthy",
-        "",
-        "STORYBOOK",
-        "Soft and dreamy, like a children's book illustration"
-    ])
-
-    add_content_slide(prs, "Step 1: Pick the Photos", [
-        "We select 3 different photos",
-        "",
-        "Different people",
-        "Different scenes",
-        "Real photos from OneDrive",
-        "",
-        "This makes the test fair"
-    ])
-
-    add_content_slide(prs, "Step 2: Transform Each Photo", [
-        "Each photo gets all 3 styles applied",
-        "",
-        "Photo 1 -> Anime, Pop Art, Storybook",
-        "Photo 2 -> Anime, Pop Art, Storybook",
-        "Photo 3 -> Anime, Pop Art, Storybook",
-        "",
-        "That's 9 transformed images total!"
-    ])
-
-    add_content_slide(prs, "Step 3: The Judges Score", [
-        "Two AI judges look at every image:",
-        "",
-        "Judge #1 (Gemini) asks:",
-        '"Does it look right? Any weird glitches?"',
-        "",
-        "Judge #2 (Claude) asks:",
-        '"Would someone want to share this?"'
-    ])
+    ("section", {
+        "title": "How It Works",
+        "color": (0, 120, 215),
+    }),
+    ("content", {
+        "title": "Think of It Like a Cooking Show",
+        "bullets": [
+            "Same ingredients (3 photos)",
+            "Different recipes (3 styles)",
+            "Expert judges score each dish",
+            "Best overall score wins!",
+            "",
+            "Fair, consistent, no favoritism",
+        ],
+        "subtitle": "A competition with clear rules",
+    }),
+    ("emoji", {
+        "title": "The Contestants",
+        "items_with_emoji": [
+            "ANIME",
+            "Big eyes, bright colors, that cool Japanese cartoon look",
+            "",
+            "POP ART",
+            "Bold colors, dots like comic books, museum-worthy",
+            "",
+            "STORYBOOK",
+            "Soft and dreamy, like a children's book illustration",
+        ],
+    }),
+    ("content", {
+        "title": "Step 1: Pick the Photos",
+        "bullets": [
+            "We select 3 different photos",
+            "",
+            "Different people",
+            "Different scenes",
+            "Real photos from OneDrive",
+            "",
+            "This makes the test fair",
+        ],
+    }),
+    ("content", {
+        "title": "Step 2: Transform Each Photo",
+        "bullets": [
+            "Each photo gets all 3 styles applied",
+            "",
+            "Photo 1 -> Anime, Pop Art, Storybook",
+            "Photo 2 -> Anime, Pop Art, Storybook",
+            "Photo 3 -> Anime, Pop Art, Storybook",
+            "",
+            "That's 9 transformed images total!",
+        ],
+    }),
+    ("content", {
+        "title": "Step 3: The Judges Score",
+        "bullets": [
+            "Two AI judges look at every image:",
+            "",
+            "Judge #1 (Gemini) asks:",
+            '"Does it look right? Any weird glitches?"',
+            "",
+            "Judge #2 (Claude) asks:",
+            '"Would someone want to share this?"',
+        ],
+    }),
 
     # ===== WHAT WE LOOK FOR =====
-    add_section_slide(prs, "What the Judges Look For", (0, 153, 153))
-
-    add_emoji_content_slide(prs, "The Quality Checklist", [
-        "Can you still tell who's in the photo?",
-        "",
-        "Is the style applied everywhere? (no weird patches)",
-        "",
-        "Does it actually look like that style?",
-        "",
-        "Are there any weird errors or glitches?",
-        "",
-        "Would you want to show this to friends?"
-    ])
-
-    add_two_column_slide(prs, "Two Different Viewpoints",
-        [
+    ("section", {
+        "title": "What the Judges Look For",
+        "color": (0, 153, 153),
+    }),
+    ("emoji", {
+        "title": "The Quality Checklist",
+        "items_with_emoji": [
+            "Can you still tell who's in the photo?",
+            "",
+            "Is the style applied everywhere? (no weird patches)",
+            "",
+            "Does it actually look like that style?",
+            "",
+            "Are there any weird errors or glitches?",
+            "",
+            "Would you want to show this to friends?",
+        ],
+    }),
+    ("two_column", {
+        "title": "Two Different Viewpoints",
+        "left_items": [
             "Checks the technical stuff",
             "",
             "Is it done correctly?",
             "Any broken parts?",
             "Does the style look real?",
             "",
-            "Like a quality inspector"
+            "Like a quality inspector",
         ],
-        [
+        "right_items": [
             "Checks the feeling",
             "",
             "Does it make you smile?",
             "Would you share it?",
             "Is it frame-worthy?",
             "",
-            "Like a friend's opinion"
+            "Like a friend's opinion",
         ],
-        "Judge #1: Quality", "Judge #2: Appeal"
-    )
-
-    add_content_slide(prs, "Step 4: Pick the Winner", [
-        "We combine both judges' scores",
-        "",
-        "A style needs to be:",
-        "Technically good (no glitches)",
-        "AND emotionally appealing (makes you go 'wow!')",
-        "",
-        "The style with best overall score wins!"
-    ])
+        "left_title": "Judge #1: Quality",
+        "right_title": "Judge #2: Appeal",
+    }),
+    ("content", {
+        "title": "Step 4: Pick the Winner",
+        "bullets": [
+            "We combine both judges' scores",
+            "",
+            "A style needs to be:",
+            "Technically good (no glitches)",
+            "AND emotionally appealing (makes you go 'wow!')",
+            "",
+            "The style with best overall score wins!",
+        ],
+    }),
 
     # ===== WHAT WE GET =====
-    add_section_slide(prs, "What We Learn", (102, 51, 153))
-
-    add_emoji_content_slide(prs, "The Results Tell Us", [
-        "Which style people will love most",
-        "",
-        "Which styles need more work",
-        "",
-        "If quality gets worse over time",
-        "",
-        "Real data instead of guessing"
-    ])
-
-    add_content_slide(prs, "Everything is Saved", [
-        "All the original photos",
-        "All 9 transformed images",
-        "All the scores and reasoning",
-        "A final report with the winner",
-        "",
-        "We can always go back and check!"
-    ])
+    ("section", {
+        "title": "What We Learn",
+        "color": (102, 51, 153),
+    }),
+    ("emoji", {
+        "title": "The Results Tell Us",
+        "items_with_emoji": [
+            "Which style people will love most",
+            "",
+            "Which styles need more work",
+            "",
+            "If quality gets worse over time",
+            "",
+            "Real data instead of guessing",
+        ],
+    }),
+    ("content", {
+        "title": "Everything is Saved",
+        "bullets": [
+            "All the original photos",
+            "All 9 transformed images",
+            "All the scores and reasoning",
+            "A final report with the winner",
+            "",
+            "We can always go back and check!",
+        ],
+    }),
 
     # ===== WHY IT MATTERS =====
-    add_section_slide(prs, "Why This Matters", (0, 153, 76))
-
-    add_two_column_slide(prs, "Before vs After",
-        [
+    ("section", {
+        "title": "Why This Matters",
+        "color": (0, 153, 76),
+    }),
+    ("two_column", {
+        "title": "Before vs After",
+        "left_items": [
             '"I think this one is better"',
             "Different opinions every time",
             "No way to track changes",
             "Takes hours to review",
-            "Can't prove anything"
+            "Can't prove anything",
         ],
-        [
+        "right_items": [
             '"The data shows this is best"',
             "Same test every time",
             "Track quality over months",
             "Done in minutes",
-            "Clear evidence to share"
+            "Clear evidence to share",
         ],
-        "Guessing", "Knowing"
-    )
-
-    add_content_slide(prs, "Better Decisions for Users", [
-        "We can confidently say:",
-        "",
-        '"Put Anime first - users love it most"',
-        '"Pop Art needs improvement here..."',
-        '"This update made Storybook worse - fix it!"',
-        "",
-        "Users get better features faster"
-    ])
+        "left_title": "Guessing",
+        "right_title": "Knowing",
+    }),
+    ("content", {
+        "title": "Better Decisions for Users",
+        "bullets": [
+            "We can confidently say:",
+            "",
+            '"Put Anime first - users love it most"',
+            '"Pop Art needs improvement here..."',
+            '"This update made Storybook worse - fix it!"',
+            "",
+            "Users get better features faster",
+        ],
+    }),
 
     # ===== OTHER USES =====
-    add_section_slide(prs, "What Else Can We Test?", (153, 102, 0))
-
-    add_emoji_content_slide(prs, "This Works for Many Things", [
-        "Compare old feature vs new feature",
-        "",
-        "Test different AI models",
-        "",
-        "Check if updates break anything",
-        "",
-        "Compare us vs competitors",
-        "",
-        "Any time we need to pick a winner!"
-    ])
-
-    add_content_slide(prs, "The Pattern", [
-        "Take something -> Change it -> Judge it -> Pick best",
-        "",
-        "Works for:",
-        "Photo filters",
-        "Video effects",
-        "Background removal",
-        "Auto-cropping",
-        "Any AI feature!"
-    ])
+    ("section", {
+        "title": "What Else Can We Test?",
+        "color": (153, 102, 0),
+    }),
+    ("emoji", {
+        "title": "This Works for Many Things",
+        "items_with_emoji": [
+            "Compare old feature vs new feature",
+            "",
+            "Test different AI models",
+            "",
+            "Check if updates break anything",
+            "",
+            "Compare us vs competitors",
+            "",
+            "Any time we need to pick a winner!",
+        ],
+    }),
+    ("content", {
+        "title": "The Pattern",
+        "bullets": [
+            "Take something -> Change it -> Judge it -> Pick best",
+            "",
+            "Works for:",
+            "Photo filters",
+            "Video effects",
+            "Background removal",
+            "Auto-cropping",
+            "Any AI feature!",
+        ],
+    }),
 
     # ===== WRAP UP =====
-    add_section_slide(prs, "In Summary", (0, 51, 102))
-
-    add_emoji_content_slide(prs, "What We Built", [
-        "An automated way to test AI features",
-        "",
-        "Fair competition between options",
-        "",
-        "Two judges with different viewpoints",
-        "",
-        "Clear winner based on data",
-        "",
-        "Everything saved for the record"
-    ])
-
-    add_big_quote_slide(
+    ("section", {
+        "title": "In Summary",
+        "color": (0, 51, 102),
+    }),
+    ("emoji", {
+        "title": "What We Built",
+        "items_with_emoji": [
+            "An automated way to test AI features",
+            "",
+            "Fair competition between options",
+            "",
+            "Two judges with different viewpoints",
+            "",
+            "Clear winner based on data",
+            "",
+            "Everything saved for the record",
+        ],
+    }),
+    ("quote", {
+        "quote": "No more guessing.\nNow we know.",
+        "attribution": "Data-driven quality",
+    }),
+    ("content", {
+        "title": "Ready to Run!",
+        "bullets": [
+            "The system is set up and tested",
+            "",
+            "Anime vs Pop Art vs Storybook",
+            "3 photos ready to go",
+            "Judges standing by",
+            "",
+            "Let the competition begin!",
+        ],
+    }),
+]
+
+_SLIDE_BUILDERS = {
+    "section": add_section_slide,
+    "content": add_content_slide,
+    "two_column": add_two_column_slide,
+    "quote": add_big_quote_slide,
+    "emoji": add_emoji_content_slide,
+}
+
+# Built decks, keyed by a hash of everything that determines their content.
+# Lives next to this script; only the most recently stored deck is kept.
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+_CACHE_PREFIX = "restyle_story_"
+
+def _deck_cache_key(date_text):
+    """Hash this module's source, the slide table, python-pptx version and date."""
+    h = hashlib.blake2b(digest_size=8)
+    with open(__file__, "rb") as f:
+        h.update(f.read())
+    h.update(repr(SLIDES).encode("utf-8"))
+    h.update(pptx.__version__.encode("ascii"))
+    h.update(date_text.encode("utf-8"))
+    return h.hexdigest()
+
+def _replace_file(src_path, dest_path):
+    """Copy src_path over dest_path via a temp file and os.replace."""
+    tmp_path = dest_path + ".tmp"
+    shutil.copyfile(src_path, tmp_path)
+    os.replace(tmp_path, dest_path)
+
+def _prune_deck_cache(keep_path):
+    """Delete cached decks other than keep_path (stale date or source)."""
+    keep_name = os.path.basename(keep_path)
+    with os.scandir(CACHE_DIR) as it:
+        for entry in it:
+            name = entry.name
+            if name != keep_name and name.startswith(_CACHE_PREFIX) and name.endswith(".pptx"):
+                os.remove(entry.path)
+
+def create_presentation(run_date=None):
+    """Create the simplified presentation.
+
+    run_date (a datetime) is the date shown on the title slide; defaults to
+    now. Passing it makes the deck content reproducible. A deck already built
+    from identical inputs is copied from CACHE_DIR instead of rebuilt.
+    """
+    run_date = run_date or datetime.now()
+    date_text = run_date.strftime("%B %d, %Y")
+    output_path = "Restyle_Benchmark_Story_Simple.pptx"
+
+    cache_path = os.path.join(CACHE_DIR, f"{_CACHE_PREFIX}{_deck_cache_key(date_text)}.pptx")
+    if os.path.exists(cache_path):
+        _replace_file(cache_path, output_path)
+        print(f"Presentation saved to: {output_path} (unchanged, from cache)")
+        return output_path
+
+    prs = Presentation()
+    prs.slide_width = _IN_10
+    prs.slide_height = _IN_7_5
+
+    # ===== TITLE =====
+    add_title_slide(
         prs,
-        "No more guessing.\nNow we know.",
-        "Data-driven quality"
+        "How Do We Know Which\nAI Style is Best?",
+        "A smart way to test OneDrive's photo magic\n" + date_text
     )
 
-    add_content_slide(prs, "Ready to Run!", [
-        "The system is set up and tested",
-        "",
-        "Anime vs Pop Art vs Storybook",
-        "3 photos ready to go",
-        "Judges standing by",
-        "",
-        "Let the competition begin!"
-    ])
-
-    # Save
-    output_path = "Restyle_Benchmark_Story_Simple.pptx"
-    prs.save(output_path)
+    for kind, kwargs in SLIDES:
+        _SLIDE_BUILDERS[kind](prs, **kwargs)
+
+    # Save: serialize in memory, then swap the file in atomically so a
+    # half-written deck never replaces the previous one
+    buf = io.BytesIO()
+    prs.save(buf)
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(buf.getbuffer())
+    os.replace(tmp_path, output_path)
     print(f"Presentation saved to: {output_path}")
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    _replace_file(output_path, cache_path)
+    _prune_deck_cache(cache_path)
     return output_path
 
 if __name__ == "__main__":